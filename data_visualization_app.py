@@ -1,17 +1,35 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
 import pandas as pd
 import sqlite3
 from PIL import Image, ImageTk
+import importlib.util
 import os
 from ttkthemes import ThemedTk
 import random
 import math
 import numpy as np
 import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+try:
+    # Optional: C-backed JSON codec for the preferences file
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    # Optional: binary codec for the preferences file; smaller and faster
+    # to pack/unpack than JSON, preferred when installed
+    import msgpack
+except ImportError:
+    msgpack = None
 import matplotlib.patheffects as path_effects
+import matplotlib.text as mtext
+import matplotlib.ticker as ticker
+from matplotlib import colors as mcolors
 
 # Chart type mapping between display names and internal names
 CHART_TYPE_MAP = {
@@ -26,7 +44,63 @@ CHART_TYPE_MAP = {
 # Reverse mapping for setting default values
 CHART_TYPE_REVERSE_MAP = {v: k for k, v in CHART_TYPE_MAP.items()}
 
+# Style palettes for the two color modes, built once at import time and
+# selected by name when the theme switches
+COLOR_PALETTES = {
+    "dark": {
+        "bg_color": "#2d2d2d",
+        "frame_bg": "#333333",
+        "sidebar_bg": "#252525",
+        "button_bg": "#444444",
+        "button_fg": "#f0f0f0",  # Light gray instead of white
+        "accent_bg": "#4a6cd4",
+        "accent_fg": "#f0f0f0",  # Light gray instead of white
+        "text_color": "#f0f0f0",  # Light gray instead of white
+        "label_bg": "#333333",
+        "entry_bg": "#3d3d3d",
+        "entry_fg": "#f0f0f0",  # Light gray instead of white
+        "table_bg": "#333333",
+        "table_fg": "#f0f0f0",  # Light gray instead of white
+        "table_selected_bg": "#4a6cd4",
+        "table_selected_fg": "#f0f0f0",  # Light gray for selected text
+        "hover_bg": "#3a3a3a",
+        "chart_colors": ["#4a6cd4", "#d44a6c", "#6cd44a", "#d4c84a", "#4ad4c8"],
+    },
+    "light": {
+        "bg_color": "#f0f0f0",
+        "frame_bg": "#f0f0f0",
+        "sidebar_bg": "#e8e8e8",
+        "button_bg": "#f0f0f0",
+        "button_fg": "#000000",
+        "accent_bg": "#4a6cd4",
+        "accent_fg": "#f0f0f0",  # Light gray instead of white
+        "text_color": "#000000",
+        "label_bg": "#f0f0f0",
+        "entry_bg": "#ffffff",
+        "entry_fg": "#000000",
+        "table_bg": "#ffffff",
+        "table_fg": "#000000",
+        "table_selected_bg": "#4a6cd4",
+        "table_selected_fg": "#f0f0f0",  # Light gray for selected text
+        "hover_bg": "#e0e0e0",
+        "chart_colors": ["#4a6cd4", "#d44a6c", "#6cd44a", "#d4c84a", "#4ad4c8"],
+    },
+}
+
 class DataVisualizationApp:
+    # Cap on the number of points handed to matplotlib per line/scatter plot
+    MAX_PLOT_POINTS = 5000
+
+    # CSV files larger than this are streamed in chunks instead of being
+    # fully materialized up front
+    STREAM_CSV_BYTES = 32 * 1024 * 1024
+
+    # Preferences location, resolved once at class creation so the save/load
+    # paths skip the repeated expanduser env lookup and path joins
+    PREFS_DIR = os.path.join(os.path.expanduser("~"), ".data_vis_app")
+    PREFS_FILE = os.path.join(PREFS_DIR, "preferences.json")
+    PREFS_FILE_MSGPACK = os.path.join(PREFS_DIR, "preferences.msgpack")
+
     def __init__(self, root):
         self.root = root
         self.root.title("数据可视化应用")
@@ -35,21 +109,23 @@ class DataVisualizationApp:
         
         # Add proper shutdown handling
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-        
-        # 配置Matplotlib支持中文
-        self.setup_matplotlib_chinese()
-        
+
         # Initialize variables before creating UI
         self.df = None  # Will hold pandas DataFrame
         self.db_conn = None  # Database connection
         self.sidebar_visible = True
         self.color_mode = "light"  # Default color mode
+        self._applied_mode = None  # Last color mode actually styled
         self.theme = tk.StringVar(value="light")  # For radio buttons
         self.chart_type = tk.StringVar(value="折线图")  # Default chart type
-        self.recent_files = []  # Track recent files
+        self.recent_files = OrderedDict()  # Recent files, newest first; O(1) move-to-front
         self.max_recent_files = 5
         self.x_column = tk.StringVar()
         self.y_column = tk.StringVar()
+        self._x_series = None  # Cached Series for the selected X column
+        self._y_series = None  # Cached Series for the selected Y column
+        self._numeric_cols = []  # Columns detected as numeric for the Y axis
+        self._numeric_cache = {}  # Memoized pd.to_numeric results per column
         self.search_var = tk.StringVar()  # For data search/filter
         
         # 初始化翻页相关变量
@@ -57,6 +133,29 @@ class DataVisualizationApp:
         self.rows_per_page = 50
         self.total_pages = 1
         self.sampled_df = None
+        self._lower_cols = None  # Cached lowercased string columns for searching
+        self._page_cache = {}  # Rendered page rows keyed by (frame, page, rows_per_page)
+        self._col_arrays = None  # Per-column numpy arrays of self.df (SoA)
+        self._col_arrays_key = None  # (id, len) of the frame the arrays mirror
+        self._columns_signature = None  # Column tuple the Treeview is built for
+        self._status_timer = None  # Pending after() id clearing the status bar
+        self._selector_sig = None  # (columns, dtypes) the selectors were built for
+        self._chinese_font_cache = None  # Resolved FontProperties, found once
+        self._sort_cache = {}  # Sorted line frames keyed by (frame, cols, len)
+        self._prefs_save_job = None  # Pending after() id of a debounced prefs save
+        self._last_pref_hash = None  # Hash of the last preferences dict written
+        self._tree_rows = None  # Row tuples the Treeview currently displays
+        self._row_index = None  # Positions of rows matching the active filter
+        self._active_len = 0  # Row count of the active (filtered or full) set
+        self._mem_db = None  # In-memory SQLite mirror of self.df for fast queries
+        self._csv_reader = None  # Active chunked CSV reader for streaming loads
+        self._est_total_rows = 0  # Estimated row count while streaming
+        self._io_pool = ThreadPoolExecutor(max_workers=2)  # Background file I/O
+        self._automaton = None  # Compiled multi-term search automaton
+        self._automaton_terms = None  # Term set the automaton was built for
+        self._fig = None  # Shared matplotlib Figure, reused across plots
+        self._canvas = None  # Shared FigureCanvasTkAgg bound to plot_frame
+        self._toolbar = None  # Navigation toolbar for the shared canvas
         
         # Configure the style
         self.style = ttk.Style()
@@ -83,11 +182,16 @@ class DataVisualizationApp:
         self.style.configure("TNotebook", padding=5)
         self.style.configure("TNotebook.Tab", font=("Microsoft YaHei UI", 10), padding=[10, 4])
         
+        # Status bar for non-blocking notifications (success messages etc.)
+        self.status_label = ttk.Label(self.root, text="", anchor=tk.W, padding=(10, 2))
+        self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
+
         # Create main containers with improved padding
         self.main_frame = ttk.Frame(self.root, padding="10")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Load user preferences before creating UI
+        os.makedirs(self.PREFS_DIR, exist_ok=True)
         self.load_user_preferences()
         
         # Update color scheme first time before creating UI elements
@@ -97,21 +201,31 @@ class DataVisualizationApp:
         self.create_sidebar()
         self.create_content_area()
         
-        # Set up keyboard shortcuts
-        self.setup_shortcuts()
-        
+        # Defer non-essential startup work (matplotlib font scan, shortcuts,
+        # drag-and-drop init) until after the first paint so the window
+        # appears immediately; none of it is needed before user interaction
+        self.root.after_idle(self.setup_matplotlib_chinese)  # 配置Matplotlib支持中文
+        self.root.after_idle(self.setup_shortcuts)
         # 延迟设置拖放功能但不显示任何错误消息
-        self.root.after(500, self.setup_drag_drop)
+        self.root.after_idle(self.setup_drag_drop)
         
     def on_closing(self):
         """Handle application shutdown cleanly"""
         try:
-            # Save user preferences
+            # Save user preferences (flushes any pending debounced save)
+            if self._prefs_save_job is not None:
+                self.root.after_cancel(self._prefs_save_job)
+                self._prefs_save_job = None
             self.save_user_preferences()
             
-            # Close database connection if open
+            # Close database connections if open
             if self.db_conn is not None:
                 self.db_conn.close()
+            if self._mem_db is not None:
+                self._mem_db.close()
+
+            # Stop background I/O workers without waiting on them
+            self._io_pool.shutdown(wait=False)
                 
             # Release any other resources here
             
@@ -169,45 +283,30 @@ class DataVisualizationApp:
         """
         if mode:
             self.color_mode = mode
-            
-        # Define colors for dark and light modes
-        if self.color_mode == "dark":
-            bg_color = "#2d2d2d"
-            frame_bg = "#333333"
-            sidebar_bg = "#252525" 
-            button_bg = "#444444"
-            button_fg = "#f0f0f0"  # Light gray instead of white
-            accent_bg = "#4a6cd4"
-            accent_fg = "#f0f0f0"  # Light gray instead of white
-            text_color = "#f0f0f0"  # Light gray instead of white
-            label_bg = "#333333"
-            entry_bg = "#3d3d3d"
-            entry_fg = "#f0f0f0"  # Light gray instead of white
-            table_bg = "#333333"
-            table_fg = "#f0f0f0"  # Light gray instead of white
-            table_selected_bg = "#4a6cd4"
-            table_selected_fg = "#f0f0f0"  # Light gray for selected text
-            hover_bg = "#3a3a3a"
-            chart_colors = ["#4a6cd4", "#d44a6c", "#6cd44a", "#d4c84a", "#4ad4c8"]
-        else:  # light mode
-            bg_color = "#f0f0f0"
-            frame_bg = "#f0f0f0"
-            sidebar_bg = "#e8e8e8"
-            button_bg = "#f0f0f0"
-            button_fg = "#000000"
-            accent_bg = "#4a6cd4"
-            accent_fg = "#f0f0f0"  # Light gray instead of white
-            text_color = "#000000"
-            label_bg = "#f0f0f0"
-            entry_bg = "#ffffff"
-            entry_fg = "#000000"
-            table_bg = "#ffffff"
-            table_fg = "#000000"
-            table_selected_bg = "#4a6cd4"
-            table_selected_fg = "#f0f0f0"  # Light gray for selected text
-            hover_bg = "#e0e0e0"
-            chart_colors = ["#4a6cd4", "#d44a6c", "#6cd44a", "#d4c84a", "#4ad4c8"]
-            
+
+        # The whole palette is derived from color_mode, so if the mode that
+        # was last applied is unchanged there is nothing to restyle
+        if self.color_mode == self._applied_mode:
+            return
+
+        # Pick the precomputed palette for this mode
+        palette = COLOR_PALETTES.get(self.color_mode, COLOR_PALETTES["light"])
+        frame_bg = palette["frame_bg"]
+        sidebar_bg = palette["sidebar_bg"]
+        button_bg = palette["button_bg"]
+        button_fg = palette["button_fg"]
+        accent_bg = palette["accent_bg"]
+        accent_fg = palette["accent_fg"]
+        text_color = palette["text_color"]
+        label_bg = palette["label_bg"]
+        table_bg = palette["table_bg"]
+        table_fg = palette["table_fg"]
+        table_selected_bg = palette["table_selected_bg"]
+        table_selected_fg = palette["table_selected_fg"]
+        hover_bg = palette["hover_bg"]
+        chart_colors = palette["chart_colors"]
+
+
         # Update styles
         self.style.configure("TFrame", background=frame_bg)
         self.style.configure("TLabelframe", background=frame_bg)
@@ -245,15 +344,20 @@ class DataVisualizationApp:
                      background=[('selected', table_selected_bg)],
                      foreground=[('selected', table_selected_fg)])
                      
-        # Store chart colors for visualization
+        # Store chart colors for visualization, pre-parsed to RGBA so
+        # matplotlib doesn't reparse the hex strings per artist
         self.chart_colors = chart_colors
+        # Tuples rather than ndarray rows: pandas would mistake a length-4
+        # float array for a list of four separate colors
+        self.chart_colors_rgba = [tuple(c) for c in mcolors.to_rgba_array(chart_colors)]
         
         # Update main container backgrounds
         self.main_frame.configure(style="TFrame")
-        
-        # Force redraw of all widgets
-        self.root.update_idletasks()
-        
+
+        # Remember what was applied; ttk propagates the style changes on its
+        # own, so no forced update_idletasks() relayout is needed here
+        self._applied_mode = self.color_mode
+
         # Save user preference (could be connected to a settings system)
         # self.settings.save_preference("color_mode", self.color_mode)
         
@@ -444,15 +548,25 @@ class DataVisualizationApp:
             messagebox.showwarning("警告", "请选择X轴和Y轴的列")
             return
             
-        # Check column types
-        x_nunique = self.df[x_col].nunique() 
-        
+        def _is_numeric(col):
+            # Cheap dtype probe first; only coerce a bounded sample when the
+            # column is object-typed, so the check never scans the full column
+            if pd.api.types.is_numeric_dtype(col):
+                return True
+            try:
+                return pd.to_numeric(col.head(1000), errors='coerce').notna().mean() > 0.9
+            except:
+                return False
+
+        x_series = self._selected_series(x_col, self._x_series)
+        y_series = self._selected_series(y_col, self._y_series)
+
+        # Check column types (a head sample is enough for UI guidance)
+        x_nunique = x_series.head(200).nunique()
+
         # See if y is numeric
-        try:
-            y_is_numeric = pd.to_numeric(self.df[y_col], errors='coerce').notna().any()
-        except:
-            y_is_numeric = False
-            
+        y_is_numeric = _is_numeric(y_series)
+
         if not y_is_numeric:
             messagebox.showinfo("推荐", "Y轴不是数值列，推荐使用柱状图显示计数。")
             self.chart_type.set("bar")
@@ -464,19 +578,13 @@ class DataVisualizationApp:
             
         elif x_nunique > 50:
             # Many unique x values - could be continuous
-            try:
-                # Check if x can be numeric
-                x_is_numeric = pd.to_numeric(self.df[x_col], errors='coerce').notna().any()
-                if x_is_numeric:
-                    messagebox.showinfo("推荐", "检测到两个数值变量，推荐使用散点图。")
-                    self.chart_type.set("scatter")
-                else:
-                    messagebox.showinfo("推荐", "检测到大量类别变量，推荐使用直方图。")
-                    self.chart_type.set("histogram")
-            except:
+            if _is_numeric(x_series):
+                messagebox.showinfo("推荐", "检测到两个数值变量，推荐使用散点图。")
+                self.chart_type.set("scatter")
+            else:
                 messagebox.showinfo("推荐", "检测到大量类别变量，推荐使用直方图。")
                 self.chart_type.set("histogram")
-                
+
         else:
             # Medium number of categories
             messagebox.showinfo("推荐", "检测到中等数量的类别，推荐使用柱状图。")
@@ -561,7 +669,7 @@ class DataVisualizationApp:
         Search functionality for the data table.
         
         Searches all columns of the DataFrame for the given search term.
-        Creates a filtered DataFrame (self.filtered_df) containing only matching rows.
+        Stores the positions of matching rows in self._row_index.
         Updates the data view to display only the matching results.
         
         Args:
@@ -573,7 +681,10 @@ class DataVisualizationApp:
         if self.df is None:
             messagebox.showwarning("警告", "没有数据可搜索")
             return
-            
+
+        # Searching needs the complete frame
+        self._ensure_all_loaded()
+
         search_term = self.search_var.get().strip().lower()
         if not search_term:
             # If search is empty, show all data
@@ -581,70 +692,232 @@ class DataVisualizationApp:
             self.update_data_view()
             return
             
-        # Search in all columns
-        results = []
-        
-        # Convert all columns to string for searching
-        str_df = self.df.astype(str)
-        
-        # Check each row
-        for idx, row in str_df.iterrows():
-            # Check if any cell contains the search term
-            if any(search_term in cell.lower() for cell in row.values):
-                results.append(idx)
-                
-        if not results:
+        # Whitespace-separated keywords are treated as alternatives: a row
+        # matches if it contains any of the terms
+        terms = search_term.split()
+
+        # Prefer the in-memory SQLite mirror: repeated substring queries run
+        # inside SQLite's C engine instead of Python
+        row_index = None
+        if self._mem_db is not None:
+            try:
+                row_index = self._query_mem_db(terms)
+            except Exception as e:
+                print(f"SQLite search failed, falling back to numpy scan: {str(e)}")
+
+        if row_index is None:
+            row_index = np.flatnonzero(self._scan_columns(terms))
+
+        if len(row_index) == 0:
             messagebox.showinfo("搜索结果", "没有找到匹配的数据")
             return
-            
-        # Create filtered dataframe
-        self.filtered_df = self.df.loc[results]
-        
+
+        # Keep only a compact array of matching row positions; pages are
+        # materialized on demand with take(), never as a copied DataFrame
+        self._row_index = row_index
+        self._page_cache.clear()
+
         # Update pagination for filtered data
         self.current_page = 0
-        self.total_pages = max(1, math.ceil(len(self.filtered_df) / self.rows_per_page))
+        self._set_pagination(len(self._row_index))
         
         # Display filtered data
         self.display_filtered_data()
         
+    def _optimize_dtypes(self):
+        """
+        Shrink the loaded DataFrame's memory footprint in place.
+
+        Integer/float columns are downcast to the smallest sufficient dtype,
+        and object columns whose values are mostly repeats become
+        categoricals, so every later scan over the data touches fewer bytes.
+
+        Returns:
+            None
+        """
+        for col in self.df.columns:
+            series = self.df[col]
+            try:
+                if pd.api.types.is_integer_dtype(series):
+                    self.df[col] = pd.to_numeric(series, downcast='integer')
+                elif pd.api.types.is_float_dtype(series):
+                    self.df[col] = pd.to_numeric(series, downcast='float')
+                elif self._is_text_dtype(series):
+                    if len(series) and series.nunique() / len(series) < 0.5:
+                        self.df[col] = series.astype('category')
+            except Exception as e:
+                print(f"Skipping dtype optimization for column {col}: {str(e)}")
+
+    @staticmethod
+    def _is_text_dtype(series):
+        """
+        True for object and string columns, excluding categoricals.
+
+        pandas 3 reads CSV text columns as the 'str' dtype, which no
+        longer compares equal to object, so a plain dtype == object check
+        silently misses every text column.
+
+        Args:
+            series: Series (or anything with a dtype) to test
+
+        Returns:
+            bool: Whether the values are uncategorized text
+        """
+        return ((pd.api.types.is_object_dtype(series)
+                 or pd.api.types.is_string_dtype(series))
+                and not isinstance(series.dtype, pd.CategoricalDtype))
+
+    def _build_search_cache(self):
+        """
+        Precompute lowercased string versions of every column for searching.
+
+        Building these once at load time means each search only pays for the
+        vectorized substring scan, not the per-cell str()/lower() conversion.
+
+        Returns:
+            None
+        """
+        if self.df is None:
+            self._lower_cols = None
+            return
+
+        self._lower_cols = {}
+        for col in self.df.columns:
+            series = self.df[col]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # Lowercase only the unique categories, then expand via codes
+                cats = series.cat.categories.astype(str).str.lower().to_numpy(dtype=str)
+                codes = series.cat.codes.to_numpy()
+                if len(cats):
+                    values = np.where(codes >= 0, cats[np.maximum(codes, 0)], "nan")
+                else:
+                    # No explicit dtype: dtype=str would mean '<U1' and
+                    # truncate the fill value to "n"
+                    values = np.full(len(codes), "nan")
+                self._lower_cols[col] = values
+            else:
+                self._lower_cols[col] = series.astype(str).str.lower().to_numpy(dtype=str)
+
+        # Mirror the frame into an in-memory SQLite table so search/filter
+        # queries can run inside SQLite's C engine
+        try:
+            if self._mem_db is not None:
+                self._mem_db.close()
+            self._mem_db = sqlite3.connect(':memory:')
+            self.df.to_sql('data', self._mem_db, index=False, if_exists='replace')
+        except Exception as e:
+            print(f"Error building in-memory search table: {str(e)}")
+            self._mem_db = None
+
+    def _query_mem_db(self, terms):
+        """
+        Run a substring search against the in-memory SQLite mirror.
+
+        SQLite's rowid numbering starts at 1 and follows insertion order, so
+        rowid - 1 is the row's position in self.df.
+
+        Args:
+            terms: List of lowercased terms; a row matches if any term occurs
+                   anywhere in any column
+
+        Returns:
+            ndarray: Positions of matching rows (int64)
+        """
+        # Escape LIKE wildcards so terms match literally, the same way the
+        # numpy fallback scan does
+        escaped = [term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                   for term in terms]
+        where = " OR ".join(
+            f'"{col}" LIKE ? ESCAPE \'\\\'' for col in self.df.columns for _ in terms
+        )
+        params = [f"%{term}%" for _ in self.df.columns for term in escaped]
+        cursor = self._mem_db.execute(f'SELECT rowid FROM data WHERE {where}', params)
+        return np.array([row[0] - 1 for row in cursor.fetchall()], dtype=np.int64)
+
+    def _scan_columns(self, terms):
+        """
+        Vectorized multi-term scan over the cached lowercase columns.
+
+        When pyahocorasick is available, all terms are matched in a single
+        linear pass over each column's joined text buffer; otherwise falls
+        back to one numpy substring scan per term.
+
+        Args:
+            terms: List of lowercased search terms
+
+        Returns:
+            ndarray: Boolean mask of matching rows
+        """
+        if self._lower_cols is None:
+            self._build_search_cache()
+
+        mask = np.zeros(len(self.df), dtype=bool)
+        automaton = self._build_automaton(terms)
+        for arr in self._lower_cols.values():
+            if automaton is not None:
+                # One pass over the whole column: join cells with a separator
+                # that can never occur in a search term, then map match
+                # offsets back to row positions
+                buf = "\x00".join(arr.tolist())
+                offsets = np.cumsum(np.char.str_len(arr) + 1)
+                for end_pos, _ in automaton.iter(buf):
+                    mask[np.searchsorted(offsets, end_pos, side='right')] = True
+            else:
+                for term in terms:
+                    mask |= np.char.find(arr, term) >= 0
+        return mask
+
+    def _build_automaton(self, terms):
+        """
+        Return a compiled Aho-Corasick automaton for the term set, or None
+        when pyahocorasick is not installed. The automaton is cached and only
+        rebuilt when the terms change.
+        """
+        try:
+            import ahocorasick
+        except ImportError:
+            return None
+
+        key = tuple(terms)
+        if self._automaton_terms != key:
+            automaton = ahocorasick.Automaton()
+            for term in terms:
+                automaton.add_word(term, term)
+            automaton.make_automaton()
+            self._automaton = automaton
+            self._automaton_terms = key
+        return self._automaton
+
     def clear_search(self):
         """Clear search and show all data"""
         self.search_var.set("")
-        if hasattr(self, 'filtered_df'):
-            del self.filtered_df
+        self._row_index = None
+        self._page_cache.clear()
+        if self.df is not None:
+            self._set_pagination(len(self.df))
         self.current_page = 0
         self.update_data_view()
         
     def display_filtered_data(self):
         """Display the filtered data in the treeview"""
-        # Clear existing data
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        if not hasattr(self, 'filtered_df') or self.filtered_df is None:
+        if self._row_index is None:
+            # Clear any leftover rows
+            self.tree.delete(*self.tree.get_children())
             return
-            
+
         # Calculate start and end index for current page
         start_idx = self.current_page * self.rows_per_page
-        end_idx = min(start_idx + self.rows_per_page, len(self.filtered_df))
-        
-        # Get the slice of data for the current page
-        page_data = self.filtered_df.iloc[start_idx:end_idx]
-        
-        # Insert filtered data
-        for _, row in page_data.iterrows():
-            # Convert all values to strings and limit their length for display
-            row_values = []
-            for val in row:
-                if val is None:
-                    row_values.append("")
-                else:
-                    str_val = str(val)
-                    if len(str_val) > 50:  # Truncate long values
-                        str_val = str_val[:47] + "..."
-                    row_values.append(str_val)
-                    
-            self.tree.insert("", "end", values=row_values)
+        end_idx = min(start_idx + self.rows_per_page, len(self._row_index))
+
+        # Render (or fetch from cache) the display rows for this page
+        rows = self._render_page(self.current_page, self._row_index)
+
+        # Suppress column redraws while the batch of rows is swapped in
+        self.tree.configure(displaycolumns=())
+        try:
+            self._fill_tree_rows(rows)
+        finally:
+            self.tree.configure(displaycolumns="#all")
         
         # Update pagination controls
         self.prev_btn["state"] = "normal" if self.current_page > 0 else "disabled"
@@ -656,20 +929,145 @@ class DataVisualizationApp:
             self.rows_btn["text"] = f"每页{self.rows_per_page}行"
         
         # Update data info label
-        self.data_info_label["text"] = f"搜索结果: {len(self.filtered_df):,} | 显示: {start_idx + 1}-{end_idx}"
+        self.data_info_label["text"] = f"搜索结果: {len(self._row_index):,} | 显示: {start_idx + 1}-{end_idx}"
     
+    def _set_pagination(self, length):
+        """
+        Recompute the cached pagination state for the active row set.
+
+        Called whenever the filter set or page size changes, so navigation
+        clicks never redo the page-count arithmetic.
+
+        Args:
+            length: Number of rows in the active (filtered or full) set
+
+        Returns:
+            None
+        """
+        self._active_len = length
+        # Integer ceiling division, avoiding float math.ceil in the hot path
+        self.total_pages = max(1, -(-length // self.rows_per_page))
+
+    def _fill_tree_rows(self, rows):
+        """
+        Put row tuples into the Treeview, reusing existing item IDs.
+
+        Updating items in place avoids Tk's per-item create/destroy
+        bookkeeping, so a page flip costs one value update per visible row
+        instead of a teardown and rebuild of the widget's item tree.
+
+        Args:
+            rows: List of row tuples to display
+
+        Returns:
+            None
+        """
+        children = self.tree.get_children()
+        prev = self._tree_rows
+
+        # Update in place where an item already exists, and only when its
+        # values actually changed — growing rows_per_page, for example,
+        # keeps every already-visible row untouched
+        for i, (item, row_values) in enumerate(zip(children, rows)):
+            if prev is not None and i < len(prev) and prev[i] == row_values:
+                continue
+            self.tree.item(item, values=row_values)
+
+        if len(rows) > len(children):
+            for row_values in rows[len(children):]:
+                self.tree.insert("", "end", values=row_values)
+        elif len(children) > len(rows):
+            self.tree.delete(*children[len(rows):])
+
+        self._tree_rows = rows
+
+    def _column_arrays(self):
+        """
+        Return the per-column numpy arrays of self.df, cached.
+
+        Rebuilt lazily when the frame is replaced or grows (streaming
+        reads); paging then indexes raw arrays with no Series boxing.
+
+        Returns:
+            list: One numpy array per column, in column order
+        """
+        key = (id(self.df), len(self.df))
+        if self._col_arrays_key != key:
+            self._col_arrays = [self.df[col].to_numpy() for col in self.df.columns]
+            self._col_arrays_key = key
+        return self._col_arrays
+
+    def _render_page(self, page_idx, row_index=None):
+        """
+        Return the truncated display row tuples for one page of self.df.
+
+        Rendered pages are memoized in self._page_cache so that flipping back
+        and forth between pages only pays the Tk insert cost after the first
+        visit. The cache is cleared whenever the underlying data changes.
+
+        Args:
+            page_idx: Zero-based page index
+            row_index: Optional array of row positions to page over (e.g. the
+                       active search result); pages over the full frame if None
+
+        Returns:
+            list: List of row tuples ready for tree.insert
+        """
+        key = (id(row_index) if row_index is not None else id(self.df),
+               page_idx, self.rows_per_page)
+        cached = self._page_cache.get(key)
+        if cached is not None:
+            return cached
+
+        start_idx = page_idx * self.rows_per_page
+        # Index the cached per-column arrays directly (SoA) rather than
+        # slicing the frame, skipping DataFrame construction per page flip
+        col_arrays = self._column_arrays()
+        if row_index is not None:
+            # Materialize only the page's rows; no filtered copy of the frame
+            end_idx = min(start_idx + self.rows_per_page, len(row_index))
+            take = row_index[start_idx:end_idx]
+            page_arrays = [col[take] for col in col_arrays]
+        else:
+            end_idx = min(start_idx + self.rows_per_page, len(self.df))
+            page_arrays = [col[start_idx:end_idx] for col in col_arrays]
+
+        # Build display rows column-by-column instead of with iterrows():
+        # each column is stringified and truncated once as an array, then the
+        # columns are zipped into row tuples only at the Tk insert boundary.
+        display_cols = []
+        for values in page_arrays:
+            arr = np.where(pd.isna(values), "", values.astype(str)).astype(str)
+            # Numeric reprs are always short, so only string-ish columns pay
+            # for the length scan and truncation below
+            if not pd.api.types.is_numeric_dtype(values):
+                # Truncate long values in C: casting to a 47-char dtype clips
+                # the strings, then the ellipsis is appended in one vector op
+                long_mask = np.char.str_len(arr) > 50
+                if long_mask.any():
+                    arr[long_mask] = np.char.add(arr[long_mask].astype('<U47'), "...")
+            display_cols.append(arr)
+
+        rows = list(zip(*display_cols))
+
+        # Keep the cache bounded; evict the oldest entry
+        if len(self._page_cache) >= 16:
+            self._page_cache.pop(next(iter(self._page_cache)))
+        self._page_cache[key] = rows
+        return rows
+
     def prev_page(self):
         if self.current_page > 0:
             self.current_page -= 1
-            if hasattr(self, 'filtered_df') and self.filtered_df is not None:
+            if self._row_index is not None:
                 self.display_filtered_data()
             else:
                 self.update_data_view()
-    
+
     def next_page(self):
         if self.current_page < self.total_pages - 1:
             self.current_page += 1
-            if hasattr(self, 'filtered_df') and self.filtered_df is not None:
+            if self._row_index is not None:
                 self.display_filtered_data()
             else:
                 self.update_data_view()
@@ -678,8 +1076,12 @@ class DataVisualizationApp:
         """Configure drag and drop functionality for the application"""
         # This function requires TkinterDnD2 library to be installed
         # Install with: pip install tkinterdnd2
+        # Probe with find_spec first: the common missing-package case then
+        # skips the import machinery and ImportError construction entirely
+        if importlib.util.find_spec('tkinterdnd2') is None:
+            print("拖放功能不可用: tkinterdnd2 未安装")
+            return
         try:
-            # Try importing tkinterdnd2 directly
             import tkinterdnd2
             from tkinterdnd2 import DND_FILES, TkinterDnD
             
@@ -755,12 +1157,16 @@ class DataVisualizationApp:
         if hasattr(self, 'drop_indicator'):
             self.drop_indicator.place_forget()
         
-        # Get file path from the drop event
-        file_path = event.data
-        
-        # Check if it's a CSV file
-        if file_path.lower().endswith('.csv'):
-            self.load_csv(file_path=file_path)
+        # Tk delivers multi-file drops as a brace-wrapped Tcl list;
+        # splitlist unpacks it (and un-braces single paths with spaces)
+        paths = self.root.tk.splitlist(event.data)
+
+        # Load the first CSV in the drop; splitext only lowercases the
+        # suffix instead of copying the whole path
+        for path in paths:
+            if os.path.splitext(path)[1].lower() == '.csv':
+                self.load_csv(file_path=path)
+                break
         else:
             messagebox.showwarning("警告", "只支持CSV文件。请拖放CSV文件。")
     
@@ -773,47 +1179,66 @@ class DataVisualizationApp:
                 return
                 
             # Get the file path from the recent files list
-            file_path = self.recent_files[selected_idx[0]]
-            
+            file_path = list(self.recent_files)[selected_idx[0]]
+
             # Load the selected file
             if os.path.exists(file_path):
                 self.load_csv(file_path=file_path)
             else:
                 messagebox.showerror("错误", f"文件不存在: {file_path}")
                 # Remove from recent files list if not found
-                self.recent_files.pop(selected_idx[0])
+                self.recent_files.pop(file_path, None)
                 self.update_recent_files_list()
         except Exception as e:
             messagebox.showerror("错误", f"加载文件时出错: {str(e)}")
     
+    def _set_status(self, text, clear_after=4000):
+        """
+        Show a transient message in the status bar.
+
+        Unlike messagebox.showinfo this does not block the mainloop, so
+        rendering of freshly loaded data continues while the message shows.
+
+        Args:
+            text: Message to display
+            clear_after: Milliseconds before the message is cleared
+
+        Returns:
+            None
+        """
+        self.status_label.config(text=text)
+        if self._status_timer is not None:
+            self.root.after_cancel(self._status_timer)
+        self._status_timer = self.root.after(
+            clear_after, lambda: self.status_label.config(text=""))
+
     def update_recent_files_list(self):
         """Update the recent files listbox with the current list of recent files"""
         # Clear the listbox
         self.recent_files_list.delete(0, tk.END)
-        
-        # Add all recent files to the listbox
-        for file_path in self.recent_files:
-            # Get the filename without the full path
-            file_name = os.path.basename(file_path)
-            self.recent_files_list.insert(tk.END, file_name)
+
+        # Add all recent files in one insert call — a single Tcl roundtrip
+        # instead of one per entry; display names were computed once on
+        # insert, so refreshes do no per-entry path work
+        if self.recent_files:
+            self.recent_files_list.insert(tk.END, *self.recent_files.values())
             
     def add_to_recent_files(self, file_path):
         """Add a file to the recent files list"""
         # Don't add if already at the top of the list
-        if self.recent_files and self.recent_files[0] == file_path:
+        if self.recent_files and next(iter(self.recent_files)) == file_path:
             return
-            
-        # Remove if already in the list (to move to top)
-        if file_path in self.recent_files:
-            self.recent_files.remove(file_path)
-            
-        # Add to the beginning of the list
-        self.recent_files.insert(0, file_path)
-        
-        # Trim list if exceeds max length
-        if len(self.recent_files) > self.max_recent_files:
-            self.recent_files = self.recent_files[:self.max_recent_files]
-            
+
+        # Move to front (re-inserting is O(1), no list scan or shift);
+        # the basename is cached as the value so list refreshes reuse it
+        self.recent_files.pop(file_path, None)
+        self.recent_files[file_path] = os.path.basename(file_path)
+        self.recent_files.move_to_end(file_path, last=False)
+
+        # Trim from the old end if exceeds max length
+        while len(self.recent_files) > self.max_recent_files:
+            self.recent_files.popitem()
+
         # Update the listbox
         self.update_recent_files_list()
     
@@ -857,33 +1282,131 @@ class DataVisualizationApp:
                 messagebox.showerror("错误", f"文件不存在: {file_path}")
                 return
                 
-            # Try different encodings for reading the CSV file
-            encodings_to_try = ['utf-8', 'gbk', 'gb18030', 'ISO-8859-1', 'cp936', 'big5']
-            
-            for encoding in encodings_to_try:
-                try:
-                    self.df = pd.read_csv(file_path, encoding=encoding)
-                    break  # If successful, break the loop
-                except UnicodeDecodeError:
-                    continue  # Try the next encoding
-                except Exception as e:
-                    # If it's not an encoding error, re-raise
-                    if not isinstance(e, UnicodeDecodeError):
-                        raise
-            
-            # If we've tried all encodings and none worked
-            if self.df is None:
-                messagebox.showerror("错误", "无法读取CSV文件，请检查文件编码。尝试了：" + ", ".join(encodings_to_try))
-                return
-            
+            # Parse in a worker thread so the Tk event loop keeps running;
+            # pandas and pyarrow release the GIL during the C-level parse.
+            # _on_csv_loaded finishes the load back on the main thread.
+            future = self._io_pool.submit(self._read_csv_file, file_path)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._on_csv_loaded, f, file_path))
+
+        except Exception as e:
+            messagebox.showerror("错误", f"加载CSV文件时出错: {str(e)}")
+            print(f"Error loading CSV: {str(e)}")
+
+    def _read_csv_file(self, file_path):
+        """
+        Parse a CSV file. Runs on a worker thread; must not touch Tk state.
+
+        Args:
+            file_path: Path of the CSV file to read
+
+        Returns:
+            tuple: (DataFrame, chunked reader or None, estimated total rows)
+
+        Raises:
+            ValueError: If the file cannot be decoded with any known encoding
+        """
+        file_size = os.path.getsize(file_path)
+
+        # Sniff the encoding once from a bounded sample so the file is
+        # normally parsed exactly once instead of once per candidate
+        detected = self._detect_encoding(file_path)
+
+        # Very large files are streamed chunk by chunk so peak memory
+        # stays at O(chunk) until the full frame is actually needed
+        if file_size > self.STREAM_CSV_BYTES:
+            try:
+                return self._open_csv_stream(file_path, detected or 'utf-8', file_size)
+            except UnicodeDecodeError:
+                pass  # Sniff missed; fall back to a full trial read
+
+        # Prefer PyArrow's multi-threaded C++ CSV parser when available;
+        # it is several times faster than pandas and uses less memory
+        try:
+            import pyarrow.csv as pacsv
+            table = pacsv.read_csv(
+                file_path,
+                read_options=pacsv.ReadOptions(use_threads=True,
+                                               encoding=detected or 'utf-8')
+            )
+            # self_destruct frees each Arrow column as it is converted, so
+            # the table and the frame never coexist in memory
+            return table.to_pandas(self_destruct=True), None, 0
+        except ImportError:
+            pass  # pyarrow not installed, use the pandas reader
+        except Exception as e:
+            # Odd dialects and sniff misses fall through to pandas
+            print(f"PyArrow CSV read failed, falling back to pandas: {str(e)}")
+
+        if detected:
+            try:
+                return pd.read_csv(file_path, encoding=detected, engine='c'), None, 0
+            except UnicodeDecodeError:
+                pass  # Sniff missed; fall back to trial decoding
+
+        # Try different encodings for reading the CSV file
+        encodings_to_try = ['utf-8', 'gbk', 'gb18030', 'ISO-8859-1', 'cp936', 'big5']
+        for encoding in encodings_to_try:
+            try:
+                return pd.read_csv(file_path, encoding=encoding), None, 0
+            except UnicodeDecodeError:
+                continue  # Try the next encoding
+
+        # If we've tried all encodings and none worked
+        raise ValueError("无法读取CSV文件，请检查文件编码。尝试了：" + ", ".join(encodings_to_try))
+
+    def _on_csv_loaded(self, future, file_path):
+        """
+        Finish a CSV load on the main thread once the worker read is done.
+
+        Args:
+            future: Completed future holding the _read_csv_file result
+            file_path: Path that was loaded, for recents and messages
+
+        Returns:
+            None
+        """
+        try:
+            self.df, self._csv_reader, self._est_total_rows = future.result()
+
+            if self._csv_reader is None:
+                # Shrink dtypes before anything else touches the frame
+                self._optimize_dtypes()
+
+                # Rebuild the search cache for the new data
+                self._build_search_cache()
+            else:
+                # Streaming: heavy caches are rebuilt once the full frame
+                # has been pulled in (see _finish_csv_stream)
+                self._lower_cols = None
+                if self._mem_db is not None:
+                    self._mem_db.close()
+                    self._mem_db = None
+
+            self._page_cache.clear()
+            self._numeric_cache.clear()
+            self._sort_cache.clear()
+
+            # Drop any search filter from the previous file: its row
+            # positions are meaningless (or out of range) in the new frame
+            self._row_index = None
+            self.search_var.set("")
+
             # Initialize pagination variables
             self.current_page = 0
             self.rows_per_page = 50
-            self.total_pages = max(1, math.ceil(len(self.df) / self.rows_per_page))
-            
-            # Create a sampled version for large datasets
-            if len(self.df) > 1000:
-                self.sampled_df = self.df.sample(n=1000, random_state=42)
+            if self._csv_reader is not None:
+                self._set_pagination(self._est_total_rows)
+            else:
+                self._set_pagination(len(self.df))
+
+            # One shared, reproducible sample for chart types without their
+            # own downsampler (pie, bar, histogram); line and scatter draw
+            # from the full frame and bound themselves via LTTB / envelope /
+            # density image
+            if self._csv_reader is None and len(self.df) > self.MAX_PLOT_POINTS:
+                self.sampled_df = self.df.sample(
+                    n=self.MAX_PLOT_POINTS, random_state=42).reset_index(drop=True)
             else:
                 self.sampled_df = None
             
@@ -900,13 +1423,148 @@ class DataVisualizationApp:
             if hasattr(self, 'notebook'):
                 self.notebook.select(0)  # Select the first (data) tab
                 
-            # Show success message
-            messagebox.showinfo("成功", f"已加载文件: {os.path.basename(file_path)}")
+            # Show success in the status bar; a modal here would block the
+            # mainloop and stall the first render of the new data
+            self._set_status(f"已加载文件: {os.path.basename(file_path)} ({len(self.df):,} 行)")
             
         except Exception as e:
             messagebox.showerror("错误", f"加载CSV文件时出错: {str(e)}")
             print(f"Error loading CSV: {str(e)}")
     
+    def _get_numeric(self, df, col):
+        """
+        Return pd.to_numeric(df[col], errors='coerce'), memoized.
+
+        Repeated plot clicks on the same column skip the re-coercion; the
+        cache is cleared when a new file is loaded.
+
+        Args:
+            df: Frame the column belongs to
+            col: Column name to coerce
+
+        Returns:
+            pd.Series: Numeric version of the column with NaN for bad values
+        """
+        key = (id(df), col)
+        cached = self._numeric_cache.get(key)
+        if cached is None:
+            cached = pd.to_numeric(df[col], errors='coerce')
+            self._numeric_cache[key] = cached
+        return cached
+
+    def _open_csv_stream(self, file_path, encoding, file_size):
+        """
+        Begin reading a large CSV lazily in chunks.
+
+        Only the first chunk is materialized here; later chunks are pulled in
+        by _ensure_rows_loaded / _ensure_all_loaded on demand. The total row
+        count is estimated from the first chunk's serialized size and
+        corrected once the file has been fully read.
+
+        Args:
+            file_path: Path of the CSV file
+            encoding: Text encoding to read with
+            file_size: Size of the file in bytes, for the row-count estimate
+
+        Returns:
+            tuple: (first chunk, chunked reader, estimated total rows)
+        """
+        reader = pd.read_csv(file_path, encoding=encoding, engine='c',
+                             low_memory=True, chunksize=self.rows_per_page * 20)
+        first = next(reader, None)
+        if first is None:
+            return pd.DataFrame(), None, 0
+
+        avg_row_bytes = max(1, len(first.to_csv(index=False).encode(encoding, 'ignore')) // len(first))
+        return first, reader, max(len(first), file_size // avg_row_bytes)
+
+    def _ensure_rows_loaded(self, n):
+        """
+        Pull chunks from an active streaming read until n rows are loaded
+        (or the file is exhausted). No-op when not streaming.
+        """
+        if self._csv_reader is None:
+            return
+        while len(self.df) < n:
+            chunk = next(self._csv_reader, None)
+            if chunk is None:
+                self._finish_csv_stream()
+                return
+            self.df = pd.concat([self.df, chunk], ignore_index=True)
+
+    def _ensure_all_loaded(self):
+        """
+        Materialize the remainder of a streaming read. Called by operations
+        that need the complete frame (search, plotting, saving).
+        """
+        if self._csv_reader is None:
+            return
+        chunks = [self.df] + list(self._csv_reader)
+        self.df = pd.concat(chunks, ignore_index=True)
+        self._finish_csv_stream()
+
+    def _finish_csv_stream(self):
+        """Close out a streaming read and build the deferred caches."""
+        self._csv_reader = None
+        self._optimize_dtypes()
+        self._build_search_cache()
+        self._page_cache.clear()
+        if self._row_index is None:
+            # Replace the row-count estimate with the real value
+            self._set_pagination(len(self.df))
+        # Streaming loads skip the sample in _on_csv_loaded because the
+        # frame is partial there; draw it now that all rows are resident
+        if len(self.df) > self.MAX_PLOT_POINTS:
+            self.sampled_df = self.df.sample(
+                n=self.MAX_PLOT_POINTS, random_state=42).reset_index(drop=True)
+
+    @staticmethod
+    def _detect_encoding(file_path, sample_size=65536):
+        """
+        Guess a CSV file's encoding from a bounded byte sample.
+
+        Fast-paths a UTF-8 BOM and a strict UTF-8 decode of the sample, then
+        falls back to charset-normalizer or chardet when installed.
+
+        Args:
+            file_path: Path of the file to probe
+            sample_size: Number of bytes to read for detection
+
+        Returns:
+            str or None: Detected encoding name, or None if undetermined
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                sample = f.read(sample_size)
+        except OSError:
+            return None
+
+        if sample.startswith(b'\xef\xbb\xbf'):
+            return 'utf-8-sig'
+        try:
+            sample.decode('utf-8')
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+
+        try:
+            from charset_normalizer import from_bytes
+            best = from_bytes(sample).best()
+            if best is not None:
+                return best.encoding
+        except ImportError:
+            pass
+
+        try:
+            import chardet
+            guess = chardet.detect(sample)
+            if guess.get('encoding'):
+                return guess['encoding']
+        except ImportError:
+            pass
+
+        return None
+
     def load_from_db(self):
         db_path = filedialog.askopenfilename(
             title="选择SQLite数据库",
@@ -945,10 +1603,21 @@ class DataVisualizationApp:
                 def load_selected_table():
                     selected_table = table_var.get()
                     try:
-                        self.df = pd.read_sql_query(f"SELECT * FROM {selected_table}", self.db_conn)
+                        # Only accept names reported by sqlite_master; table
+                        # names cannot be bound parameters, so whitelist +
+                        # quoting is the safe way to interpolate one
+                        if selected_table not in table_names:
+                            messagebox.showerror("错误", f"未知的表: {selected_table}")
+                            return
+                        quoted = selected_table.replace('"', '""')
+                        # Stream in bounded chunks so peak memory stays at
+                        # O(chunk) while the frame is assembled
+                        chunks = pd.read_sql_query(
+                            f'SELECT * FROM "{quoted}"', self.db_conn, chunksize=50000)
+                        self.df = pd.concat(chunks, ignore_index=True)
                         self.update_data_view()
                         self.update_column_selectors()
-                        messagebox.showinfo("成功", f"已加载表: {selected_table}")
+                        self._set_status(f"已加载表: {selected_table}")
                         dialog.destroy()
                     except Exception as e:
                         messagebox.showerror("错误", f"加载表时出错: {str(e)}")
@@ -962,7 +1631,11 @@ class DataVisualizationApp:
         if self.df is None:
             messagebox.showwarning("警告", "没有数据可保存")
             return
-        
+
+        # Saving needs the complete frame
+        self._ensure_all_loaded()
+
+
         db_path = filedialog.asksaveasfilename(
             title="保存到SQLite数据库",
             defaultextension=".db",
@@ -977,8 +1650,19 @@ class DataVisualizationApp:
                 table_name = tk.simpledialog.askstring("表名", "输入表名:", parent=self.root)
                 
                 if table_name:
-                    self.df.to_sql(table_name, conn, if_exists='replace', index=False)
-                    messagebox.showinfo("成功", f"数据已保存到表 {table_name}")
+                    # WAL with relaxed fsync makes the bulk insert I/O-bound
+                    # instead of fsync-bound; fine for a fresh export file
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                    # Batched multi-row INSERTs inside a single transaction
+                    # instead of one statement + implicit commit per row.
+                    # rows * cols per batch must stay under SQLite's bound
+                    # variable limit (999 in older builds)
+                    chunksize = max(1, 900 // max(1, len(self.df.columns)))
+                    with conn:
+                        self.df.to_sql(table_name, conn, if_exists='replace',
+                                       index=False, method='multi', chunksize=chunksize)
+                    self._set_status(f"数据已保存到表 {table_name}")
                 
                 conn.close()
                 
@@ -1001,47 +1685,29 @@ class DataVisualizationApp:
         Returns:
             None
         """
-        # Clear existing data
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Clear columns
-        for column in self.tree["columns"]:
-            self.tree.heading(column, text="")
-        
         if self.df is not None:
-            # Configure columns
-            columns = list(self.df.columns)
-            self.tree.configure(columns=columns)
-            
-            # Set column headings
-            self.tree["show"] = "headings"
-            for col in columns:
-                self.tree.heading(col, text=col)
-                # Set a reasonable column width
-                self.tree.column(col, width=100)
-            
+            # Pull more chunks if a streaming read hasn't reached this page
+            self._ensure_rows_loaded((self.current_page + 1) * self.rows_per_page)
+
+            # Columns only change on (re)load, so page flips skip the
+            # O(cols) heading/width Tcl calls entirely
+            self._rebuild_columns()
+
             # Calculate start and end index for current page
             start_idx = self.current_page * self.rows_per_page
             end_idx = min(start_idx + self.rows_per_page, len(self.df))
             
-            # Get the slice of data for the current page
-            page_data = self.df.iloc[start_idx:end_idx]
-            
-            # Insert data for current page
-            for _, row in page_data.iterrows():
-                # Convert all values to strings and limit their length for display
-                row_values = []
-                for val in row:
-                    if val is None:
-                        row_values.append("")
-                    else:
-                        str_val = str(val)
-                        if len(str_val) > 50:  # Truncate long values
-                            str_val = str_val[:47] + "..."
-                        row_values.append(str_val)
-                        
-                self.tree.insert("", "end", values=row_values)
+            # Render the page through the shared vectorized path: columns are
+            # stringified and truncated as arrays, not cell by cell
+            rows = self._render_page(self.current_page)
+
+            # Swap the page in with column redraws suppressed; existing items
+            # are updated in place rather than destroyed and recreated
+            self.tree.configure(displaycolumns=())
+            try:
+                self._fill_tree_rows(rows)
+            finally:
+                self.tree.configure(displaycolumns="#all")
             
             # Update pagination controls
             self.prev_btn["state"] = "normal" if self.current_page > 0 else "disabled"
@@ -1055,7 +1721,12 @@ class DataVisualizationApp:
             # Update data info label
             self.data_info_label["text"] = f"总行数: {len(self.df):,} | 显示: {start_idx + 1}-{end_idx}"
         else:
-            # Reset pagination if no data
+            # No data: drop any leftover rows and reset pagination
+            for column in self.tree["columns"]:
+                self.tree.heading(column, text="")
+            self._columns_signature = None
+            self._tree_rows = None
+            self.tree.delete(*self.tree.get_children())
             self.prev_btn["state"] = "disabled"
             self.next_btn["state"] = "disabled"
             self.page_label["text"] = "页 0/0"
@@ -1066,6 +1737,37 @@ class DataVisualizationApp:
                 
             self.data_info_label["text"] = "没有数据"
     
+    def _rebuild_columns(self):
+        """
+        (Re)configure the Treeview columns for the current DataFrame.
+
+        No-op when the column set is unchanged since the last rebuild, so
+        page navigation never pays the per-column heading and width calls.
+
+        Returns:
+            None
+        """
+        columns = list(self.df.columns)
+        signature = tuple(columns)
+        if signature == self._columns_signature:
+            return
+
+        self.tree.configure(columns=columns)
+        self.tree["show"] = "headings"
+        first_page = self.df.iloc[:self.rows_per_page]
+        for col in columns:
+            self.tree.heading(col, text=col)
+            # Fixed width with stretch disabled lets Tk skip measuring
+            # every inserted value; the width is sized from the header
+            # and the first page only, which is cheap and bounded
+            if len(first_page):
+                content_len = int(first_page[col].astype(str).str.len().max())
+            else:
+                content_len = 0
+            width = min(300, max(60, 8 * max(len(str(col)), content_len)))
+            self.tree.column(col, width=width, minwidth=40, stretch=False, anchor='w')
+        self._columns_signature = signature
+
     def update_column_selectors(self):
         """
         Update the X and Y axis column selectors with available DataFrame columns.
@@ -1078,27 +1780,44 @@ class DataVisualizationApp:
         """
         if self.df is not None:
             columns = list(self.df.columns)
-            
+
+            # Reloading a file with the same schema (edit/save/reload loop)
+            # keeps the selectors and numeric scan results; only refresh the
+            # cached Series, which point at the old frame
+            sig = (tuple(columns), tuple(str(d) for d in self.df.dtypes))
+            if sig == self._selector_sig:
+                x_col, y_col = self.x_column.get(), self.y_column.get()
+                self._x_series = self.df[x_col] if x_col in self.df.columns else None
+                self._y_series = self.df[y_col] if y_col in self.df.columns else None
+                return
+            self._selector_sig = sig
+
             # 清除之前的值
             self.x_column.set("")
             self.y_column.set("")
-            
+
             # All columns can be used for X-axis (categorical)
             self.x_combobox['values'] = columns
             if columns:
                 self.x_combobox.current(0)
                 self.x_column.set(columns[0])  # 显式设置变量值
             
-            # Only numeric columns should be suggested for Y-axis
-            numeric_columns = []
+            # Only numeric columns should be suggested for Y-axis.
+            # Columns pandas already knows are numeric cost nothing to
+            # detect; object columns are probed against a bounded head
+            # sample instead of coercing every value.
+            numeric_set = set(self.df.select_dtypes(include='number').columns)
             for col in columns:
-                # Try to identify numeric columns
+                if col in numeric_set:
+                    continue
                 try:
-                    # Check if column has any numeric values
-                    if pd.to_numeric(self.df[col], errors='coerce').notna().any():
-                        numeric_columns.append(col)
+                    sample = self.df[col].head(1000)
+                    if pd.to_numeric(sample, errors='coerce').notna().any():
+                        numeric_set.add(col)
                 except:
                     continue
+            numeric_columns = [col for col in columns if col in numeric_set]
+            self._numeric_cols = numeric_columns
             
             # If we found numeric columns, use those for Y-axis options
             if numeric_columns:
@@ -1115,6 +1834,10 @@ class DataVisualizationApp:
                     self.y_combobox.current(0)
                     self.y_column.set(columns[0])  # 显式设置变量值
                 messagebox.showwarning("警告", "未检测到数值列。可视化需要数值数据。")
+
+            # Refresh the cached Series for the new default selections
+            self._x_series = self.df[self.x_column.get()] if self.x_column.get() else None
+            self._y_series = self.df[self.y_column.get()] if self.y_column.get() else None
     
     def create_plot(self):
         """
@@ -1135,7 +1858,10 @@ class DataVisualizationApp:
         if self.df is None:
             messagebox.showwarning("警告", "没有数据可视化")
             return
-        
+
+        # Plotting needs the complete frame
+        self._ensure_all_loaded()
+
         x_col = self.x_column.get()
         y_col = self.y_column.get()
         
@@ -1187,14 +1913,20 @@ class DataVisualizationApp:
                 print(f"未知图表类型: {chart_display_type}, 使用默认折线图")
                 chart_type = "line"
             
-            # Use the sampled dataframe for plotting to improve performance
-            work_df = self.sampled_df if self.sampled_df is not None else self.df
+            # Line and scatter plots have shape-preserving downsamplers
+            # (LTTB / min-max envelope / density image), so they draw from
+            # the full frame; chart types without one keep the shared
+            # random sample
+            if chart_type in ("line", "scatter") or self.sampled_df is None:
+                work_df = self.df
+            else:
+                work_df = self.sampled_df
             
             # Make a copy to avoid modifying original data
             plot_df = work_df.copy()
             
             # Check if Y column has any potential numeric values
-            if not pd.to_numeric(plot_df[y_col], errors='coerce').notna().any():
+            if not self._get_numeric(work_df, y_col).notna().any():
                 progress_window.destroy()
                 # Special case: If user selected a non-numeric column for Y-axis, suggest using count instead
                 response = messagebox.askyesno("提示", 
@@ -1234,8 +1966,8 @@ class DataVisualizationApp:
                     messagebox.showinfo("提示", "请选择包含数值的列作为Y轴")
                     return
             else:
-                # Convert Y column to numeric, coercing errors
-                plot_df[y_col] = pd.to_numeric(plot_df[y_col], errors='coerce')
+                # Convert Y column to numeric, coercing errors (memoized)
+                plot_df[y_col] = self._get_numeric(work_df, y_col)
                 
                 # Check if we have any valid numeric data after conversion
                 if plot_df[y_col].isna().all():
@@ -1251,11 +1983,17 @@ class DataVisualizationApp:
                     messagebox.showerror("错误", f"转换为数值后没有有效数据")
                     return
                 
-                # Check for outliers in the data
-                Q1 = plot_df[y_col].quantile(0.25)
-                Q3 = plot_df[y_col].quantile(0.75)
-                IQR = Q3 - Q1
-                has_extreme_outliers = plot_df[y_col].max() > Q3 + 5 * IQR
+                # Check for outliers with one quantile pass over the raw
+                # ndarray — a single sort instead of one per percentile.
+                # Small frames plot fine even with outliers, so they skip
+                # the scan (and the modal it can trigger) entirely
+                has_extreme_outliers = False
+                if len(plot_df) >= 5000:
+                    vals = plot_df[y_col].to_numpy(dtype=np.float64, copy=False)
+                    vals = vals[~np.isnan(vals)]
+                    p01, Q1, Q3, p99 = np.quantile(vals, [0.01, 0.25, 0.75, 0.99])
+                    IQR = Q3 - Q1
+                    has_extreme_outliers = vals.max() > Q3 + 5 * IQR
                 
                 # Initialize outlier handling variables
                 use_log_scale = False
@@ -1295,12 +2033,13 @@ class DataVisualizationApp:
                         
                         if len(plot_df) < 10:  # If we filtered too much, use a more lenient approach
                             plot_df = work_df.copy()
-                            plot_df[y_col] = pd.to_numeric(plot_df[y_col], errors='coerce')
+                            plot_df[y_col] = self._get_numeric(work_df, y_col)
                             plot_df = plot_df.dropna(subset=[y_col])
                             
-                            # Just remove the most extreme values
-                            lower_bound = plot_df[y_col].quantile(0.01)  # 1st percentile
-                            upper_bound = plot_df[y_col].quantile(0.99)  # 99th percentile
+                            # Just remove the most extreme values, reusing the
+                            # 1st/99th percentiles from the single pass above
+                            lower_bound = p01
+                            upper_bound = p99
                             plot_df = plot_df[(plot_df[y_col] >= lower_bound) & (plot_df[y_col] <= upper_bound)]
                         
                         outlier_msg = f"已移除 {old_count - len(plot_df)} 个异常值。"
@@ -1328,17 +2067,8 @@ class DataVisualizationApp:
                         use_log_scale = True
                         outlier_msg = "已应用对数刻度。"
                 
-                # If there are too many data points for a meaningful visualization, sample or aggregate
-                if len(plot_df) > 1000 and chart_type in ["scatter", "line"]:
-                    # For scatter plots with many points, sample for better performance
-                    plot_df = plot_df.sample(n=1000, random_state=42)
-            
-            # Clear previous plot
-            for widget in self.plot_frame.winfo_children():
-                widget.destroy()
-            
-            # Create figure and axis with higher resolution for large datasets
-            fig, ax = plt.subplots(figsize=(10, 6), dpi=120)
+            # Reuse the shared figure/canvas; only the axes content changes
+            ax = self._get_plot_axes(figsize=(10, 6))
             
             # 确保中文字体设置生效
             try:
@@ -1361,7 +2091,7 @@ class DataVisualizationApp:
             
             if chart_type != "pie" and chart_type != "heatmap" and x_values_count > 20:
                 # Rotate x labels for better readability
-                plt.xticks(rotation=45, ha='right')
+                ax.tick_params(axis='x', labelrotation=45)
                 
                 # If still too many values, thin out the labels
                 if x_values_count > 50:
@@ -1385,7 +2115,7 @@ class DataVisualizationApp:
                     messagebox.showerror("错误", f"选择的列 '{x_col}' 或 '{y_col}' 在处理后的数据中不存在。")
                     return
                 
-                plot_df.plot(kind='bar', x=x_col, y=y_col, ax=ax, color='skyblue')
+                plot_df.plot(kind='bar', x=x_col, y=y_col, ax=ax, color=self.chart_colors_rgba[0])
                 
                 # Apply log scale if needed
                 if use_log_scale:
@@ -1406,60 +2136,62 @@ class DataVisualizationApp:
                         messagebox.showerror("错误", "没有足够的数据点创建折线图")
                         return
                         
-                    # Try to identify if X is a date column
-                    is_date = False
-                    try:
-                        # Check for a few date values (not all, for performance)
-                        sample = plot_df[x_col].head(5)
-                        pd.to_datetime(sample, errors='raise')
-                        # If no error, it's likely a date
-                        plot_df['temp_date'] = pd.to_datetime(plot_df[x_col], errors='coerce')
-                        # Count how many valid dates we got
-                        date_count = plot_df['temp_date'].notna().sum()
-                        if date_count > len(plot_df) * 0.5:  # If more than half converted successfully
-                            is_date = True
-                            # Sort by the date
-                            plot_df = plot_df.sort_values(by='temp_date')
-                            # Drop rows where date conversion failed
-                            plot_df = plot_df.dropna(subset=['temp_date'])
-                    except:
-                        # Not a date, continue with normal processing
-                        pass
-                        
-                    if not is_date:
-                        # Try to convert x to numeric for sorting if possible
-                        try:
-                            x_numeric = pd.to_numeric(plot_df[x_col], errors='coerce')
-                            # If at least some values converted, consider it numeric
-                            if x_numeric.notna().sum() > len(plot_df) * 0.5:
-                                # Sort by the numeric values
-                                plot_df['temp_num'] = x_numeric
-                                plot_df = plot_df.sort_values(by='temp_num')
-                                # Drop rows where numeric conversion failed
-                                plot_df = plot_df.dropna(subset=['temp_num'])
-                            else:
-                                # Not enough numeric values, sort as strings
-                                plot_df = plot_df.sort_values(by=x_col)
-                        except:
-                            # Fall back to string sort
-                            plot_df = plot_df.sort_values(by=x_col)
-                    
+                    # Cycling chart types over the same data re-runs the
+                    # sniff-and-sort below for nothing, so its result is
+                    # memoized per source frame/columns/row count; the
+                    # cache is cleared when a new file is loaded
+                    sort_key = (id(work_df), x_col, y_col, len(plot_df))
+                    cached = self._sort_cache.get(sort_key)
+                    if cached is None:
+                        cached = self._prepare_line_frame(plot_df, x_col, y_col)
+                        if len(self._sort_cache) >= 8:
+                            self._sort_cache.pop(next(iter(self._sort_cache)))
+                        self._sort_cache[sort_key] = cached
+                    plot_df, is_date = cached
+
                     # Check if we still have enough data after conversions
                     if len(plot_df) < 2:
                         progress_window.destroy()
                         messagebox.showerror("错误", "处理后没有足够的数据点创建折线图")
                         return
-                    
-                    # Create the line plot
-                    plot_df.plot(kind='line', x=x_col, y=y_col, ax=ax, color='green', marker='o', markersize=4)
+
+                    # Downsample very long series before drawing. Series far
+                    # beyond the canvas width use a per-pixel-column min/max
+                    # envelope (2 points per column, spikes survive exactly);
+                    # moderately long ones use LTTB, which keeps the visual
+                    # shape with a bounded point count
+                    line_marker = 'o'
+                    if len(plot_df) > self.MAX_PLOT_POINTS:
+                        y_arr = plot_df[y_col].to_numpy(dtype=float)
+                        width_px = int(ax.figure.get_size_inches()[0] * ax.figure.dpi)
+                        if len(plot_df) > 20 * width_px:
+                            keep = self._envelope_indices(y_arr, width_px)
+                            line_marker = None  # Markers would just smear
+                        else:
+                            keep = self._lttb_indices(y_arr, self.MAX_PLOT_POINTS)
+                        plot_df = plot_df.iloc[keep]
+
+                    # Create the line plot straight on the Axes with ndarray
+                    # views; pandas' plot wrapper adds converter and
+                    # reindexing layers that cost more than the draw itself
+                    line_x = plot_df['temp_date' if is_date else x_col].to_numpy()
+                    ax.plot(line_x, plot_df[y_col].to_numpy(),
+                            color=self.chart_colors_rgba[2], marker=line_marker, markersize=4)
                     
                     # Apply log scale if needed
                     if use_log_scale:
                         ax.set_yscale('log')
                         
-                    # Rotate x-axis labels if there are many points or they are long strings
-                    if len(plot_df) > 10 or (isinstance(plot_df[x_col].iloc[0], str) and len(str(plot_df[x_col].iloc[0])) > 8):
-                        plt.xticks(rotation=45, ha='right')
+                    # Rotate x-axis labels if there are many points or they
+                    # are not numeric/date values; the dtype check costs
+                    # O(1) instead of an iloc indexer round-trip per plot
+                    # (and unlike dtype == object it also covers pandas 3's
+                    # 'str' dtype)
+                    x_series = plot_df[x_col]
+                    if len(plot_df) > 10 or not (
+                            pd.api.types.is_numeric_dtype(x_series)
+                            or pd.api.types.is_datetime64_any_dtype(x_series)):
+                        ax.tick_params(axis='x', labelrotation=45)
                         
                     # Limit x-ticks if there are too many points
                     if len(plot_df) > 20:
@@ -1477,9 +2209,47 @@ class DataVisualizationApp:
                     progress_window.destroy()
                     messagebox.showerror("错误", f"选择的列 '{x_col}' 或 '{y_col}' 在处理后的数据中不存在。")
                     return
-                
-                plot_df.plot(kind='scatter', x=x_col, y=y_col, ax=ax, color='purple', alpha=0.6)
-                
+
+                # Dispatch on the x dtype like _prepare_line_frame does:
+                # datetime and numeric columns pass through unchanged
+                # (coercing them to numeric would turn every value into
+                # NaN and render an empty chart); only object columns are
+                # coerced, with an explicit error when nothing survives
+                x_ser = plot_df[x_col]
+                x_is_date = pd.api.types.is_datetime64_any_dtype(x_ser)
+                if x_is_date or pd.api.types.is_numeric_dtype(x_ser):
+                    x_num = x_ser
+                else:
+                    x_num = pd.to_numeric(x_ser, errors='coerce')
+                    if not x_num.notna().any():
+                        progress_window.destroy()
+                        messagebox.showerror("错误", f"X轴列 '{x_col}' 不包含可用于散点图的数值数据")
+                        return
+                dense = x_num.notna() & plot_df[y_col].notna()
+                if not x_is_date and dense.sum() > self.MAX_PLOT_POINTS:
+                    # Dense scatter: render point density as an image so draw
+                    # cost is bounded by the bin grid, not the row count
+                    counts, xedges, yedges = np.histogram2d(
+                        x_num[dense], plot_df.loc[dense, y_col], bins=200)
+                    ax.imshow(counts.T, origin='lower', aspect='auto',
+                              extent=[xedges[0], xedges[-1], yedges[0], yedges[-1]],
+                              cmap='viridis')
+                    ax.set_xlabel(x_col)
+                    ax.set_ylabel(y_col)
+                else:
+                    # Direct Axes.scatter on ndarray views, bypassing the
+                    # pandas plot wrapper. Datetime x can't be binned by
+                    # histogram2d, so dense date series are thinned by an
+                    # even stride instead
+                    xv = x_num.to_numpy()
+                    yv = plot_df[y_col].to_numpy()
+                    if len(xv) > self.MAX_PLOT_POINTS:
+                        step = -(-len(xv) // self.MAX_PLOT_POINTS)
+                        xv = xv[::step]
+                        yv = yv[::step]
+                    ax.scatter(xv, yv,
+                               color=self.chart_colors_rgba[1], alpha=0.6)
+
                 # Apply log scale if needed
                 if use_log_scale:
                     ax.set_yscale('log')
@@ -1500,16 +2270,33 @@ class DataVisualizationApp:
                     
                     # Prepare pie data
                     if y_col == 'Count':  # If we're using our count-based approach
-                        pie_data = plot_df.set_index(x_col)[y_col]
+                        # plot_df is already aggregated here; build the Series
+                        # directly instead of set_index, which would copy and
+                        # uniqueness-check the label column
+                        pie_data = pd.Series(
+                            plot_df[y_col].to_numpy(),
+                            index=pd.Index(plot_df[x_col].to_numpy(), name=x_col))
                     else:
-                        # Group by x and sum y values
-                        pie_data = plot_df.groupby(x_col)[y_col].sum()
+                        # Categorical keys group over int codes instead of
+                        # re-hashing variable-length strings
+                        if self._is_text_dtype(plot_df[x_col]):
+                            plot_df = plot_df.assign(
+                                **{x_col: plot_df[x_col].astype('category')})
+                        # Group by x and sum y values; sort=False skips the
+                        # post-aggregation key sort (slice order is cosmetic
+                        # and big pies get re-sorted below anyway) and
+                        # observed=True keeps category dtypes from emitting
+                        # empty groups
+                        pie_data = plot_df.groupby(x_col, sort=False, observed=True)[y_col].sum()
                     
                     # Handle negative values which can't be shown in a pie chart
                     if (pie_data < 0).any():
                         progress_window.destroy()
                         messagebox.showwarning("警告", "饼图不能包含负值。将使用绝对值。")
-                        pie_data = pie_data.abs()
+                        # np.abs over the raw values reuses the existing
+                        # index; Series.abs would copy it as well
+                        pie_data = pd.Series(np.abs(pie_data.to_numpy()),
+                                             index=pie_data.index, name=pie_data.name)
                         
                     # Make sure we have data to plot
                     if len(pie_data) == 0 or pie_data.sum() == 0:
@@ -1517,24 +2304,36 @@ class DataVisualizationApp:
                         messagebox.showerror("错误", "没有有效数据可用于饼图")
                         return
                     
-                    # If pie chart has too many categories, limit to top N plus "Others"
+                    # If pie chart has too many categories, limit to top N plus
+                    # "Others": one sort, then positional splits — no isin hash
+                    # set or boolean-mask allocation over the full series
                     if len(pie_data) > 10:
-                        top_n = pie_data.nlargest(9)
-                        others_sum = pie_data[~pie_data.index.isin(top_n.index)].sum()
-                        
+                        pie_data = pie_data.sort_values(ascending=False)
+                        others_sum = pie_data.iloc[9:].sum()
+                        top_n = pie_data.iloc[:9]
+
                         # Create a new Series with top_n values and an "Others" category
                         if others_sum > 0:
                             pie_data = pd.concat([top_n, pd.Series({"其他": others_sum})])
+                        else:
+                            pie_data = top_n
                     
+                    # Slightly separate the pieces, but only while the effect
+                    # is visible; many-slice pies skip the per-wedge offset
+                    # layout (and the list allocation) entirely
+                    explode = np.full(len(pie_data), 0.05) if len(pie_data) <= 8 else None
+
                     # Create the pie chart with percentage labels and a legend
                     wedges, texts, autotexts = pie_data.plot(
-                        kind='pie', 
-                        ax=ax, 
+                        kind='pie',
+                        ax=ax,
                         autopct='%1.1f%%',
                         startangle=90,
                         counterclock=False,
-                        shadow=True,
-                        explode=[0.05] * len(pie_data),  # Slightly separate all pieces
+                        # The blurred shadow patch doubles per-wedge draw
+                        # cost and is invisible on busy pies
+                        shadow=(len(pie_data) <= 5),
+                        explode=explode,
                         textprops={'fontsize': 10}
                     )
                     
@@ -1626,49 +2425,57 @@ class DataVisualizationApp:
                 
                 # For histograms, calculate an appropriate number of bins based on data distribution
                 if len(plot_df) > 0:
+                    # One contiguous float64 buffer with NaNs dropped feeds
+                    # every step below (quantiles, range, sign check, draw)
+                    # instead of reconverting the Series each time
+                    yv = pd.to_numeric(plot_df[y_col], errors='coerce').to_numpy(
+                        dtype=np.float64, copy=False)
+                    yv = yv[np.isfinite(yv)]
                     try:
                         # Calculate Freedman-Diaconis rule for bin width
-                        q75, q25 = np.percentile(plot_df[y_col], [75, 25])
+                        q75, q25 = np.quantile(yv, [0.75, 0.25])
                         iqr = q75 - q25
                         if iqr > 0:
-                            bin_width = 2 * iqr / (len(plot_df) ** (1/3))
-                            data_range = plot_df[y_col].max() - plot_df[y_col].min()
+                            bin_width = 2 * iqr / (len(yv) ** (1/3))
+                            data_range = yv.max() - yv.min()
                             # Ensure a reasonable number of bins
                             num_bins = max(10, min(50, int(data_range / bin_width) if bin_width > 0 else 20))
                         else:
                             # If IQR is zero, use square root rule
-                            num_bins = min(30, max(5, int(math.sqrt(len(plot_df)))))
-                        
+                            num_bins = min(30, max(5, int(math.sqrt(len(yv)))))
+
                         # Check for outliers and adjust bin range if necessary
                         if 'has_extreme_outliers' in locals() and has_extreme_outliers and use_log_scale:
                             # Use log scale for histogram with positive values
-                            if (plot_df[y_col] > 0).all():
-                                ax.set_xscale('log')
-                                plot_df[y_col].plot(kind='hist', ax=ax, bins=num_bins, color='orange', edgecolor='black', alpha=0.7)
+                            if (yv > 0).all():
+                                # Bin in log10 space directly: bins stay
+                                # visually uniform and the linear tick
+                                # locator replaces the log locator pass
+                                self._draw_hist(ax, np.log10(yv), num_bins)
+                                ax.xaxis.set_major_formatter(
+                                    ticker.FuncFormatter(lambda v, _: f"10^{v:.1f}"))
                             else:
                                 # Handle potential negative values by shifting data
-                                min_val = plot_df[y_col].min()
+                                min_val = yv.min()
                                 if min_val <= 0:
                                     shift = abs(min_val) + 1
-                                    shifted_data = plot_df[y_col] + shift
-                                    shifted_data.plot(kind='hist', ax=ax, bins=num_bins, color='orange', edgecolor='black', alpha=0.7)
+                                    self._draw_hist(ax, yv + shift, num_bins)
                                     # Adjust x-axis labels to show original values
-                                    import matplotlib.ticker as ticker
                                     def format_fn(tick_val, tick_pos):
                                         return str(int(tick_val - shift))
                                     ax.xaxis.set_major_formatter(ticker.FuncFormatter(format_fn))
                                 else:
-                                    plot_df[y_col].plot(kind='hist', ax=ax, bins=num_bins, color='orange', edgecolor='black', alpha=0.7)
+                                    self._draw_hist(ax, yv, num_bins)
                         else:
                             # Normal histogram with automatic bins
-                            plot_df[y_col].plot(kind='hist', ax=ax, bins=num_bins, color='orange', edgecolor='black', alpha=0.7)
-                    
+                            self._draw_hist(ax, yv, num_bins)
+
                     except Exception as histogram_error:
                         # Fallback to simpler histogram settings in case of error
                         print(f"直方图生成错误，使用备选方案: {str(histogram_error)}")
                         try:
                             # Simple histogram with fixed number of bins
-                            plot_df[y_col].plot(kind='hist', ax=ax, bins=15, color='orange', alpha=0.7)
+                            self._draw_hist(ax, yv, 15, edgecolor=None)
                         except Exception as e:
                             progress_window.destroy()
                             messagebox.showerror("错误", f"无法创建直方图: {str(e)}")
@@ -1692,25 +2499,12 @@ class DataVisualizationApp:
             
             # Add gridlines for better readability
             ax.grid(True, linestyle='--', alpha=0.7)
-            
+
             # Tight layout to make sure everything fits
-            plt.tight_layout()
-            
-            # Create a toolbar with save option
-            from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
-            
-            # Create a canvas for the plot
-            canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
-            canvas.draw()
-            
-            # Add toolbar
-            toolbar_frame = ttk.Frame(self.plot_frame)
-            toolbar_frame.pack(side=tk.TOP, fill=tk.X)
-            toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
-            toolbar.update()
-            
-            # Pack the canvas after the toolbar
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self._fig.tight_layout()
+
+            # Redraw the shared canvas with the new axes content
+            self._canvas.draw_idle()
             
             # Close progress window
             if 'progress_window' in locals() and progress_window.winfo_exists():
@@ -1729,6 +2523,227 @@ class DataVisualizationApp:
             import traceback
             traceback.print_exc()
     
+    @staticmethod
+    def _lttb_indices(y, max_points):
+        """
+        Largest-triangle-three-buckets downsampling for line data.
+
+        Selects the points that preserve the visual shape of the series
+        (peaks and valleys survive) while bounding how many points
+        matplotlib has to draw. Assumes the data is already sorted along x.
+
+        Args:
+            y: Numeric y values as a float ndarray
+            max_points: Number of points to keep
+
+        Returns:
+            ndarray: Sorted positions of the selected points
+        """
+        n = len(y)
+        if n <= max_points:
+            return np.arange(n)
+
+        x = np.arange(n, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+
+        # First and last points are always kept; the interior is bucketed
+        edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+        indices = np.empty(max_points, dtype=np.int64)
+        indices[0] = 0
+        indices[-1] = n - 1
+
+        selected = 0  # Position of the previously selected point
+        for i in range(max_points - 2):
+            start, end = edges[i], edges[i + 1]
+            if end <= start:
+                end = start + 1
+
+            # The "third triangle point" is the average of the next bucket
+            nxt_end = edges[i + 2] if i + 2 <= max_points - 2 else n
+            avg_x = x[end:nxt_end].mean() if nxt_end > end else x[n - 1]
+            avg_y = y[end:nxt_end].mean() if nxt_end > end else y[n - 1]
+
+            # Pick the bucket point forming the largest triangle with the
+            # previous selection and the next bucket's average
+            bx = x[start:end]
+            by = y[start:end]
+            area = np.abs((x[selected] - avg_x) * (by - y[selected])
+                          - (x[selected] - bx) * (avg_y - y[selected]))
+            selected = start + int(np.argmax(area))
+            indices[i + 1] = selected
+
+        return indices
+
+    @staticmethod
+    def _envelope_indices(y, buckets):
+        """
+        Min/max envelope decimation for very long sorted-x line data.
+
+        Splits the series into one bucket per output pixel column and keeps
+        only each bucket's minimum and maximum, so matplotlib strokes about
+        2 * buckets segments instead of one per row. Spikes survive exactly;
+        anything finer than a pixel column could not be seen anyway.
+
+        Args:
+            y: Numeric y values as a float ndarray
+            buckets: Number of buckets (target pixel columns)
+
+        Returns:
+            ndarray: Sorted positions of the selected points
+        """
+        n = y.size
+        edges = np.linspace(0, n, buckets + 1).astype(np.int64)
+        keep = np.empty(2 * buckets, dtype=np.int64)
+        count = 0
+        for start, end in zip(edges[:-1], edges[1:]):
+            if end <= start:
+                continue
+            seg = y[start:end]
+            lo = start + int(np.nanargmin(seg))
+            hi = start + int(np.nanargmax(seg))
+            keep[count] = min(lo, hi)
+            count += 1
+            if hi != lo:
+                keep[count] = max(lo, hi)
+                count += 1
+        return keep[:count]
+
+    def _prepare_line_frame(self, plot_df, x_col, y_col):
+        """
+        Project to the plotted columns and sort them for a line chart.
+
+        Args:
+            plot_df: Working frame the line will be drawn from
+            x_col: X-axis column name
+            y_col: Y-axis column name
+
+        Returns:
+            tuple: (sorted narrow frame, True when x was treated as dates)
+        """
+        # Only x and y are plotted, so sort and copy just those two
+        # columns; wide frames would otherwise drag every other column
+        # through each sort_values below
+        plot_df = plot_df[[x_col] if x_col == y_col else [x_col, y_col]]
+
+        # Try to identify if X is a date column. Typed columns are
+        # dispatched on dtype in O(1) before any sniffing: datetime64
+        # needs no parse, numeric sorts directly
+        is_date = False
+        x_sorted = False
+        if pd.api.types.is_datetime64_any_dtype(plot_df[x_col]):
+            # Already typed as dates: no parsing needed at all
+            is_date = True
+            plot_df['temp_date'] = plot_df[x_col]
+            plot_df = plot_df.sort_values(by='temp_date')
+            plot_df = plot_df.dropna(subset=['temp_date'])
+        elif pd.api.types.is_numeric_dtype(plot_df[x_col]):
+            # Already numeric: sort directly, skip both sniffs
+            plot_df = plot_df.sort_values(by=x_col)
+            x_sorted = True
+        else:
+            try:
+                # Check for a few date values (not all, for performance)
+                sample = plot_df[x_col].head(5)
+                pd.to_datetime(sample, errors='raise')
+                # Guess one strptime format from the sample so the full
+                # column skips per-row format inference; with cache=True
+                # duplicate strings then cost one hash lookup instead of
+                # a C parse each
+                date_format = None
+                try:
+                    from pandas.tseries.api import guess_datetime_format
+                    date_format = guess_datetime_format(str(sample.iloc[0]))
+                except Exception:
+                    pass  # Older pandas; full inference still works
+                # If no error, it's likely a date
+                plot_df['temp_date'] = pd.to_datetime(
+                    plot_df[x_col], errors='coerce', format=date_format, cache=True)
+                # Count how many valid dates we got
+                date_count = plot_df['temp_date'].notna().sum()
+                if date_count > len(plot_df) * 0.5:  # If more than half converted successfully
+                    is_date = True
+                    # Sort by the date
+                    plot_df = plot_df.sort_values(by='temp_date')
+                    # Drop rows where date conversion failed
+                    plot_df = plot_df.dropna(subset=['temp_date'])
+            except:
+                # Not a date, continue with normal processing
+                pass
+
+        if not is_date and not x_sorted:
+            # Try to convert x to numeric for sorting if possible
+            try:
+                x_numeric = pd.to_numeric(plot_df[x_col], errors='coerce')
+                # If at least some values converted, consider it numeric
+                if x_numeric.notna().sum() > len(plot_df) * 0.5:
+                    # Sort by the numeric values
+                    plot_df['temp_num'] = x_numeric
+                    plot_df = plot_df.sort_values(by='temp_num')
+                    # Drop rows where numeric conversion failed
+                    plot_df = plot_df.dropna(subset=['temp_num'])
+                else:
+                    # Not enough numeric values, sort as strings
+                    plot_df = plot_df.sort_values(by=x_col)
+            except:
+                # Fall back to string sort
+                plot_df = plot_df.sort_values(by=x_col)
+
+        return plot_df, is_date
+
+    def _draw_hist(self, ax, y, bins, edgecolor='black'):
+        """
+        Draw a histogram via precomputed bins and one ax.bar call.
+
+        np.histogram_bin_edges + np.histogram make a single C-level pass
+        over the data; ax.hist would recompute edges internally and route
+        through matplotlib's heavier per-dataset wrapper.
+
+        Args:
+            ax: Target Axes
+            y: Numeric values as a float ndarray
+            bins: Bin count (or anything np.histogram_bin_edges accepts)
+            edgecolor: Bar outline color, None for none
+
+        Returns:
+            ndarray: The bin edges used
+        """
+        edges = np.histogram_bin_edges(y, bins=bins)
+        counts, _ = np.histogram(y, bins=edges)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+               color=self.chart_colors_rgba[3], edgecolor=edgecolor, alpha=0.7)
+        return edges
+
+    def _get_plot_axes(self, figsize=(10, 6)):
+        """
+        Return a cleared Axes on the shared Figure/Canvas pair.
+
+        The Figure, Tk canvas and navigation toolbar are built once on first
+        use and reused for every subsequent plot. Rebuilding them per chart
+        thrashes the heap and accumulates matplotlib artists; clearing the
+        figure keeps redraw cost proportional to the new chart only.
+
+        Args:
+            figsize: Figure size in inches for this plot
+
+        Returns:
+            matplotlib.axes.Axes: Empty axes ready to draw on
+        """
+        if self._fig is None:
+            self._fig = Figure(figsize=figsize, dpi=120)
+            self._canvas = FigureCanvasTkAgg(self._fig, master=self.plot_frame)
+
+            toolbar_frame = ttk.Frame(self.plot_frame)
+            toolbar_frame.pack(side=tk.TOP, fill=tk.X)
+            self._toolbar = NavigationToolbar2Tk(self._canvas, toolbar_frame)
+            self._toolbar.update()
+
+            self._canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        else:
+            self._fig.clf()
+            self._fig.set_size_inches(*figsize)
+
+        return self._fig.add_subplot(111)
+
     def create_heatmap_plot(self, plot_df, x_col, y_col, group_col):
         """
         Create and display a heatmap visualization.
@@ -1758,31 +2773,36 @@ class DataVisualizationApp:
             progress_bar.start()
             progress_window.update()
             
-            # Create pivot table for heatmap
-            pivot_data = plot_df.pivot_table(
-                values=y_col,
-                index=x_col,
-                columns=group_col,
-                aggfunc=np.mean,
-                fill_value=0
-            )
+            # Categorical keys group over int codes instead of re-hashing
+            # variable-length strings on both axes of the pivot
+            cat_cols = {col: plot_df[col].astype('category')
+                        for col in (x_col, group_col)
+                        if self._is_text_dtype(plot_df[col])}
+            if cat_cols:
+                plot_df = plot_df.assign(**cat_cols)
+
+            # Create pivot table for heatmap. groupby().mean().unstack() hits
+            # the cythonized mean kernel; pivot_table with a callable aggfunc
+            # goes through the generic (slow) aggregation path
+            pivot_data = (plot_df
+                          .groupby([x_col, group_col], observed=True, sort=False)[y_col]
+                          .mean()
+                          .unstack(fill_value=0))
             
-            # Clear previous plot
-            for widget in self.plot_frame.winfo_children():
-                widget.destroy()
-                
-            # Create figure and axis
-            fig, ax = plt.subplots(figsize=(10, 8), dpi=120)
+            # Reuse the shared figure/canvas; only the axes content changes
+            ax = self._get_plot_axes(figsize=(10, 8))
             
             # Apply Chinese font if available
             if hasattr(self, 'apply_chinese_font_to_plot'):
                 self.apply_chinese_font_to_plot(ax)
                 
-            # Create heatmap
-            cax = ax.matshow(pivot_data, cmap='viridis', aspect='auto')
+            # Create heatmap; float32 is plenty for display and halves the
+            # memory bandwidth through the norm/cmap pipeline on large grids
+            mat = pivot_data.to_numpy(dtype=np.float32, copy=False)
+            cax = ax.matshow(mat, cmap='viridis', aspect='auto')
             
             # Add colorbar
-            fig.colorbar(cax, ax=ax, label=y_col)
+            self._fig.colorbar(cax, ax=ax, label=y_col)
             
             # Set x and y labels
             ax.set_xlabel(group_col)
@@ -1796,14 +2816,15 @@ class DataVisualizationApp:
             if len(x_labels) > 20:
                 x_step = max(1, len(x_labels) // 20)
                 x_positions = np.arange(0, len(x_labels), x_step)
-                x_labels = [x_labels[i] for i in x_positions]
+                # Index.take gathers in C instead of element-by-element
+                x_labels = pivot_data.columns.take(x_positions)
             else:
                 x_positions = np.arange(len(x_labels))
-                
+
             if len(y_labels) > 20:
                 y_step = max(1, len(y_labels) // 20)
                 y_positions = np.arange(0, len(y_labels), y_step)
-                y_labels = [y_labels[i] for i in y_positions]
+                y_labels = pivot_data.index.take(y_positions)
             else:
                 y_positions = np.arange(len(y_labels))
                 
@@ -1816,21 +2837,10 @@ class DataVisualizationApp:
             ax.set_title(f"{y_col} 热力图 ({x_col} vs {group_col})")
             
             # Adjust layout
-            plt.tight_layout()
-            
-            # Create canvas for the plot
-            canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
-            canvas.draw()
-            
-            # Add toolbar
-            from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
-            toolbar_frame = ttk.Frame(self.plot_frame)
-            toolbar_frame.pack(side=tk.TOP, fill=tk.X)
-            toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
-            toolbar.update()
-            
-            # Pack the canvas
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self._fig.tight_layout()
+
+            # Redraw the shared canvas with the new axes content
+            self._canvas.draw_idle()
             
             # Close progress window
             if progress_window.winfo_exists():
@@ -1899,15 +2909,27 @@ class DataVisualizationApp:
         selected = self.x_combobox.get()
         if selected:
             self.x_column.set(selected)
+            # Cache the Series so later checks skip the column lookup
+            if self.df is not None and selected in self.df.columns:
+                self._x_series = self.df[selected]
             print(f"已选择X轴列: {selected}")
-    
+
     def on_y_selected(self, event=None):
         """处理Y轴列选择变更事件"""
         selected = self.y_combobox.get()
         if selected:
             self.y_column.set(selected)
+            # Cache the Series so later checks skip the column lookup
+            if self.df is not None and selected in self.df.columns:
+                self._y_series = self.df[selected]
             print(f"已选择Y轴列: {selected}")
 
+    def _selected_series(self, col, cached):
+        """Return the cached Series for col if it is current, else look it up."""
+        if cached is not None and cached.name == col:
+            return cached
+        return self.df[col]
+
     def setup_matplotlib_chinese(self):
         """配置Matplotlib以支持中文显示"""
         try:
@@ -1972,7 +2994,12 @@ class DataVisualizationApp:
         try:
             import matplotlib.font_manager as font_manager
             import platform
-            
+
+            # 字体查找已缓存则直接复用，跳过整个文件系统扫描
+            if self._chinese_font_cache is not None:
+                self._apply_font_to_axes(ax, self._chinese_font_cache)
+                return
+
             # 获取全局已配置的字体设置作为首选
             global_fonts = plt.rcParams.get('font.sans-serif', [])
             
@@ -2026,71 +3053,151 @@ class DataVisualizationApp:
             if chinese_font is None:
                 chinese_font = font_manager.FontProperties(family='sans-serif')
                 print("未找到中文字体，使用默认无衬线字体")
-            
-            # 应用字体到图表中的各元素
-            if ax.get_title():
-                ax.set_title(ax.get_title(), fontproperties=chinese_font)
-            
-            ax.set_xlabel(ax.get_xlabel(), fontproperties=chinese_font)
-            ax.set_ylabel(ax.get_ylabel(), fontproperties=chinese_font)
-            
-            # 设置X轴刻度标签的字体
-            for label in ax.get_xticklabels():
-                label.set_fontproperties(chinese_font)
-            
-            # 设置Y轴刻度标签的字体
-            for label in ax.get_yticklabels():
-                label.set_fontproperties(chinese_font)
-            
-            # 设置图例的字体
-            legend = ax.get_legend()
-            if legend:
-                for text in legend.get_texts():
-                    text.set_fontproperties(chinese_font)
-            
+
+            # 缓存查找结果，后续图表零扫描开销
+            self._chinese_font_cache = chinese_font
+
+            self._apply_font_to_axes(ax, chinese_font)
+
         except Exception as e:
             print(f"应用中文字体到图表失败: {str(e)}")
             # 出错时不中断程序，只记录错误
 
+    @staticmethod
+    def _apply_font_to_axes(ax, chinese_font):
+        """把已解析的字体应用到图表中的各元素"""
+        if chinese_font is None:
+            return
+        # 一次遍历覆盖标题、轴标签、刻度、图例和饼图文本等所有文字元素，
+        # 避免逐类设置时反复触发布局失效
+        for text in ax.findobj(mtext.Text):
+            text.set_fontproperties(chinese_font)
+
+    def schedule_save_preferences(self):
+        """
+        Queue a preferences save after 500 ms of quiescence.
+
+        Rapid consecutive setting changes collapse into one file rewrite
+        instead of hitting the disk from the Tk main thread per change.
+
+        Returns:
+            None
+        """
+        if self._prefs_save_job is not None:
+            self.root.after_cancel(self._prefs_save_job)
+        self._prefs_save_job = self.root.after(500, self._run_scheduled_save)
+
+    def _run_scheduled_save(self):
+        """
+        Run a debounced preferences save off the Tk main thread.
+
+        The preferences dict is snapshotted here (on the main thread) and
+        only the disk write runs on the I/O pool, so a slow or networked
+        home directory never stalls the event loop.
+        """
+        self._prefs_save_job = None
+        preferences = self._build_preferences()
+        h = self._prefs_hash(preferences)
+        if h == self._last_pref_hash:
+            return
+        self._io_pool.submit(self._write_and_record, preferences, h)
+
+    def _write_and_record(self, preferences, h):
+        """Write preferences and remember their hash on success."""
+        if self._write_preferences(preferences):
+            self._last_pref_hash = h
+
+    @staticmethod
+    def _prefs_hash(preferences):
+        """Hash a preferences dict so identical saves can be skipped."""
+        return hash(tuple(sorted(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k, v in preferences.items())))
+
+    def _build_preferences(self):
+        """Snapshot the current settings as a preferences dict."""
+        return {
+            # Clipped so the saved list can never outgrow the display limit
+            "recent_files": list(self.recent_files)[:self.max_recent_files],
+            "color_mode": self.color_mode,
+            "rows_per_page": self.rows_per_page,
+            "last_directory": os.path.dirname(next(iter(self.recent_files))) if self.recent_files else ""
+        }
+
+    @staticmethod
+    def _write_preferences(preferences):
+        """
+        Write a preferences dict to disk. Safe to run on a worker thread.
+
+        Args:
+            preferences: Dict produced by _build_preferences
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            # Pack with msgpack when installed (binary, no whitespace or
+            # escape handling), otherwise fall back to JSON with orjson
+            # serializing in C when available. The directory is created
+            # once in __init__.
+            if msgpack is not None:
+                prefs_file = DataVisualizationApp.PREFS_FILE_MSGPACK
+                data = msgpack.packb(preferences)
+            else:
+                # Compact output: the file is machine-read only, and the
+                # stdlib encoder pays per-item Python string work for
+                # indentation
+                prefs_file = DataVisualizationApp.PREFS_FILE
+                if orjson is not None:
+                    data = orjson.dumps(preferences)
+                else:
+                    data = json.dumps(preferences, ensure_ascii=False,
+                                      separators=(',', ':')).encode('utf-8')
+
+            # Write to a sibling temp file and rename over the target so a
+            # crash mid-write can never leave a truncated preferences file
+            tmp_file = prefs_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, prefs_file)
+
+            return True
+        except Exception as e:
+            print(f"Error saving preferences: {str(e)}")
+            return False
+
     def save_user_preferences(self):
         """
-        Save user preferences to a JSON file for persistence between sessions.
-        
+        Save user preferences to disk, synchronously.
+
+        Used at shutdown where the write must land before the process
+        exits; interactive setting changes go through
+        schedule_save_preferences instead.
+
         Saves:
         - Recent files list
         - Color/theme mode
         - Default rows per page
         - Last used directory
-        
+
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            # Create preferences dictionary
-            preferences = {
-                "recent_files": self.recent_files,
-                "color_mode": self.color_mode,
-                "rows_per_page": self.rows_per_page,
-                "last_directory": os.path.dirname(self.recent_files[0]) if self.recent_files else ""
-            }
-            
-            # Create preferences directory if it doesn't exist
-            prefs_dir = os.path.join(os.path.expanduser("~"), ".data_vis_app")
-            os.makedirs(prefs_dir, exist_ok=True)
-            
-            # Save to JSON file
-            prefs_file = os.path.join(prefs_dir, "preferences.json")
-            with open(prefs_file, 'w', encoding='utf-8') as f:
-                json.dump(preferences, f, ensure_ascii=False, indent=2)
-                
+        preferences = self._build_preferences()
+        h = self._prefs_hash(preferences)
+        if h == self._last_pref_hash:
+            # Nothing changed since the last flush; the file is current
             return True
-        except Exception as e:
-            print(f"Error saving preferences: {str(e)}")
-            return False
+        if self._write_preferences(preferences):
+            self._last_pref_hash = h
+            return True
+        return False
             
     def load_user_preferences(self):
         """
-        Load user preferences from a JSON file.
+        Load user preferences from disk.
         
         Loads:
         - Recent files list
@@ -2102,35 +3209,93 @@ class DataVisualizationApp:
             bool: True if successful, False otherwise
         """
         try:
-            # Check if preferences file exists
-            prefs_file = os.path.join(os.path.expanduser("~"), ".data_vis_app", "preferences.json")
-            if not os.path.exists(prefs_file):
+            # Prefer the msgpack file; fall back to the legacy JSON file so
+            # existing installs migrate on their next save
+            if msgpack is not None and os.path.exists(self.PREFS_FILE_MSGPACK):
+                with open(self.PREFS_FILE_MSGPACK, 'rb') as f:
+                    preferences = msgpack.unpackb(f.read(), raw=False)
+            elif os.path.exists(self.PREFS_FILE):
+                # Load from JSON file as one bytes buffer (both codecs take it)
+                with open(self.PREFS_FILE, 'rb') as f:
+                    buf = f.read()
+                preferences = orjson.loads(buf) if orjson is not None else json.loads(buf)
+            else:
                 return False
                 
-            # Load from JSON file
-            with open(prefs_file, 'r', encoding='utf-8') as f:
-                preferences = json.load(f)
-                
-            # Apply preferences
-            if "recent_files" in preferences:
+            # Apply preferences; .get hashes each key once instead of the
+            # membership-test-then-index double lookup
+            recent = preferences.get("recent_files")
+            if recent is not None:
                 # Filter only existing files
-                self.recent_files = [file for file in preferences["recent_files"] 
-                                    if os.path.exists(file)]
-                self.update_recent_files_list()
-                
-            if "color_mode" in preferences:
-                self.color_mode = preferences["color_mode"]
+                # Clip to the display limit before stat'ing anything, so a
+                # preferences file that grew unbounded cannot trigger a
+                # stat per stale entry on startup
+                self.recent_files = OrderedDict(
+                    (file, os.path.basename(file))
+                    for file in self._filter_existing(recent[:self.max_recent_files]))
+                # At startup the sidebar listbox does not exist yet — a
+                # direct refresh would raise and the except below would
+                # swallow the remaining preferences. Defer it until the UI
+                # has been built
+                if hasattr(self, 'recent_files_list'):
+                    self.update_recent_files_list()
+                else:
+                    self.root.after_idle(self.update_recent_files_list)
+
+            color_mode = preferences.get("color_mode")
+            if color_mode is not None:
+                self.color_mode = color_mode
                 self.theme.set(self.color_mode)
                 self.update_color_scheme()
-                
-            if "rows_per_page" in preferences:
-                self.rows_per_page = preferences["rows_per_page"]
+
+            rows_per_page = preferences.get("rows_per_page")
+            if rows_per_page is not None:
+                # Clamp to the dialog's 10-200 range once at load; a zero or
+                # negative value from a hand-edited file would break the
+                # ceiling division in _set_pagination
+                try:
+                    self.rows_per_page = min(200, max(10, int(rows_per_page)))
+                except (TypeError, ValueError):
+                    pass
                 
             return True
         except Exception as e:
             print(f"Error loading preferences: {str(e)}")
             return False
 
+    @staticmethod
+    def _filter_existing(paths):
+        """
+        Keep only paths that are regular files, with one directory scan
+        per parent.
+
+        Recent files usually share a folder, so this turns one stat() per
+        path into one scandir() per distinct directory — a real saving on
+        network mounts. File-ness comes from entry.is_file(), so a
+        directory that sneaks into the list cannot pass the filter and
+        blow up in the CSV loader later. Unreadable directories fall back
+        to per-path os.path.isfile. Input order is preserved.
+
+        Args:
+            paths: Iterable of file paths
+
+        Returns:
+            list: The paths that are existing files, in input order
+        """
+        by_dir = {}
+        for path in paths:
+            by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+        found = set()
+        for directory, members in by_dir.items():
+            try:
+                names = {entry.name for entry in os.scandir(directory or '.')
+                         if entry.is_file()}
+                found.update(p for p in members if os.path.basename(p) in names)
+            except OSError:
+                found.update(p for p in members if os.path.isfile(p))
+        return [p for p in paths if p in found]
+
     def change_rows_per_page(self):
         """
         Let users change the number of rows displayed per page in the data view.
@@ -2155,48 +3320,57 @@ class DataVisualizationApp:
             if new_rows is not None:
                 # Update rows per page setting
                 self.rows_per_page = new_rows
+                self._page_cache.clear()
                 
-                # Recalculate total pages
+                # Recalculate total pages for the active row set
                 if self.df is not None:
-                    self.total_pages = max(1, math.ceil(len(self.df) / self.rows_per_page))
+                    active_len = len(self._row_index) if self._row_index is not None else len(self.df)
+                    self._set_pagination(active_len)
                     self.current_page = min(self.current_page, self.total_pages - 1)
                     
                     # Update data view
                     self.update_data_view()
                 
-                # Save preferences
-                self.save_user_preferences()
+                # Save preferences (debounced; bursts of changes write once)
+                self.schedule_save_preferences()
                 
         except Exception as e:
             messagebox.showerror("错误", f"设置每页行数时出错: {str(e)}")
             
 # Tooltip class implementation for enhanced UX
 class CreateToolTip:
+    # One hidden Toplevel shared by every tooltip: hovering only moves the
+    # window and swaps the label text instead of creating and destroying
+    # Tk windows on each pointer crossing
+    _shared_tip = None
+    _shared_label = None
+
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
-        self.tooltip = None
         self.widget.bind("<Enter>", self.show_tooltip)
         self.widget.bind("<Leave>", self.hide_tooltip)
-        
+
     def show_tooltip(self, event=None):
         x, y, _, _ = self.widget.bbox("insert")
         x += self.widget.winfo_rootx() + 25
         y += self.widget.winfo_rooty() + 25
-        
-        # Create a toplevel window
-        self.tooltip = tk.Toplevel(self.widget)
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{x}+{y}")
-        
-        label = ttk.Label(self.tooltip, text=self.text, wraplength=180,
-                       background="#ffffca", relief="solid", borderwidth=1)
-        label.pack(padx=1, pady=1)
-        
+
+        cls = CreateToolTip
+        if cls._shared_tip is None or not cls._shared_tip.winfo_exists():
+            cls._shared_tip = tk.Toplevel(self.widget)
+            cls._shared_tip.wm_overrideredirect(True)
+            cls._shared_label = ttk.Label(cls._shared_tip, wraplength=180,
+                                          background="#ffffca", relief="solid", borderwidth=1)
+            cls._shared_label.pack(padx=1, pady=1)
+
+        cls._shared_label.config(text=self.text)
+        cls._shared_tip.wm_geometry(f"+{x}+{y}")
+        cls._shared_tip.deiconify()
+
     def hide_tooltip(self, event=None):
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        if CreateToolTip._shared_tip is not None and CreateToolTip._shared_tip.winfo_exists():
+            CreateToolTip._shared_tip.withdraw()
 
 if __name__ == "__main__":
     # 通过命令行参数控制是否启用拖放功能
@@ -2216,14 +3390,15 @@ if __name__ == "__main__":
         print("Falling back to standard tkinter")
     
     # 如果启用了拖放功能，在创建界面前预加载tkinterdnd2
-    if enable_dnd:
+    # find_spec 只探测 sys.path，不执行模块代码，缺包时无异常开销
+    if enable_dnd and importlib.util.find_spec('tkinterdnd2'):
         try:
             import tkinterdnd2
             print("Successfully imported tkinterdnd2")
-        except ImportError:
-            print("tkinterdnd2 not available, drag and drop will be disabled")
         except Exception as e:
             print(f"Error importing tkinterdnd2: {str(e)}")
+    elif enable_dnd:
+        print("tkinterdnd2 not available, drag and drop will be disabled")
     
     # 创建应用实例
     app = DataVisualizationApp(root)